@@ -0,0 +1,221 @@
+"""
+Shared fixtures for the demo test suite.
+"""
+import copy
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from click.testing import CliRunner
+
+from src.factories.ai_provider_factory import AIProviderFactory
+from src.interfaces.base_interfaces import TestCase, TestType
+
+
+# Generated stubs whose target functions are not defined anywhere in the tree.
+GENERATED_STUBS = {"test_calculate_average.py", "test_clear_history.py", "test_generated.py"}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-generated",
+        action="store_true",
+        default=False,
+        help="also run the generated stub tests listed in GENERATED_STUBS",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect the generated stubs unless --run-generated is given."""
+    if config.getoption("--run-generated"):
+        return
+    selected, deselected = [], []
+    for item in items:
+        (deselected if item.path.name in GENERATED_STUBS else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="module")
+def sample_unit_test_case():
+    """A unit TestCase for my_function; providers only read it."""
+    return TestCase(
+        name="test_function",
+        test_type=TestType.UNIT,
+        function_name="my_function",
+        description="Test my function",
+        test_code="def test_function(): pass"
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_edge_test_case():
+    """An edge TestCase for my_function with an assertion placeholder."""
+    return TestCase(
+        name="test_edge_case",
+        test_type=TestType.EDGE,
+        function_name="my_function",
+        description="Test edge case",
+        test_code="def test_edge_case(): # Assert"
+    )
+
+
+@pytest.fixture(scope="module")
+def python_context():
+    """Provider context for Python code."""
+    return {'language': 'python'}
+
+
+@pytest.fixture(scope="session")
+def shared_parser():
+    """One CodeParser per xdist worker; tests must not rely on its caches being cold."""
+    from src.analyzers.code_parser import CodeParser
+    return CodeParser()
+
+
+@pytest.fixture(scope="session")
+def factory():
+    """One AIProviderFactory for the session, used by tests that only create providers."""
+    return AIProviderFactory()
+
+
+@pytest.fixture
+def factory_fresh():
+    """A per-test AIProviderFactory for tests that register providers."""
+    return AIProviderFactory()
+
+
+@pytest.fixture(scope="session")
+def _cfg_modules():
+    """The configuration classes, imported on first use rather than at collection."""
+    from src.config.ai_provider_manager import AIProviderManager
+    from src.config.configuration_manager import ConfigurationManager
+    return AIProviderManager, ConfigurationManager
+
+
+@pytest.fixture(scope="session")
+def openai_mock_template():
+    """An OpenAI client mock whose chat completion answers "test analysis".
+
+    Shared by the whole session; tests only read the canned response.
+    """
+    client = Mock()
+    client.chat.completions.create.return_value = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="test analysis"))]
+    )
+    return client
+
+
+@pytest.fixture
+def cfg_spec(_cfg_modules):
+    """A fresh Mock specced on ConfigurationManager for each test."""
+    _, ConfigurationManager = _cfg_modules
+    return Mock(spec=ConfigurationManager)
+
+
+@pytest.fixture(scope="session")
+def default_config_manager(_cfg_modules):
+    """A ConfigurationManager with default settings, loaded once per session."""
+    _, ConfigurationManager = _cfg_modules
+    return ConfigurationManager(config_path=None)
+
+
+@pytest.fixture(scope="module")
+def base_manager(_cfg_modules, default_config_manager):
+    """An AIProviderManager built once per module; tests get copies of it."""
+    AIProviderManager, _ = _cfg_modules
+    return AIProviderManager(default_config_manager)
+
+
+@pytest.fixture
+def ai_manager(base_manager):
+    """A per-test copy of base_manager with no cached provider or health results."""
+    manager = copy.copy(base_manager)
+    manager._current_provider = None
+    manager._provider_health = {}
+    return manager
+
+
+@pytest.fixture
+def mock_openai(monkeypatch):
+    """Stand-in for the openai module; mock_openai.OpenAI replaces the SDK client class."""
+    fake = MagicMock()
+    monkeypatch.setattr('src.factories.ai_provider_factory._OpenAIClient', fake.OpenAI)
+    return fake
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Remove AI provider API keys from the environment for one test."""
+    for name in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GEMINI_API_KEY"):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def openai_only(clean_env, monkeypatch):
+    """Expose only an OpenAI API key."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+
+
+@pytest.fixture
+def both_keys(clean_env, monkeypatch):
+    """Expose OpenAI and Anthropic API keys."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test_key")
+
+
+@pytest.fixture(scope="session")
+def cli_main():
+    """The Click entry point, imported on first use rather than at collection."""
+    from src.main import main
+    return main
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """A CliRunner for the CLI tests; each invoke() runs in its own isolated context."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def sample_factory(tmp_path_factory):
+    """Write a source file once per (name, content) and return its path.
+
+    Files live in a session temp dir, so tests that ask for the same sample
+    share one file; tests must not modify it.
+    """
+    base = tmp_path_factory.mktemp("cli_samples")
+    cache = {}
+
+    def make(name: str, content: str) -> Path:
+        key = (name, content)
+        if key not in cache:
+            directory = base / str(len(cache))
+            directory.mkdir()
+            path = directory / name
+            path.write_text(content, encoding="utf-8")
+            cache[key] = path
+        return cache[key]
+
+    return make
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def load_fixture():
+    """Return the bytes of a source file under ``demo_tests/fixtures``.
+
+    Each file is read once per session, on first use.
+    """
+    cache = {}
+
+    def load(name: str) -> bytes:
+        if name not in cache:
+            cache[name] = (FIXTURES_DIR / name).read_bytes()
+        return cache[name]
+
+    return load
@@ -0,0 +1,81 @@
+"""
+A sample calculator module for testing.
+"""
+import math
+from typing import List, Optional
+
+class ScientificCalculator:
+    """A calculator with scientific functions."""
+    
+    def __init__(self):
+        self.memory = 0.0
+        self.history: List[str] = []
+    
+    def add(self, a: float, b: float) -> float:
+        """Add two numbers."""
+        result = a + b
+        self._record_operation(f"{a} + {b} = {result}")
+        return result
+    
+    def multiply(self, a: float, b: float) -> float:
+        """Multiply two numbers."""
+        result = a * b
+        self._record_operation(f"{a} * {b} = {result}")
+        return result
+    
+    def divide(self, a: float, b: float) -> float:
+        """Divide two numbers."""
+        if b == 0:
+            raise ValueError("Division by zero")
+        result = a / b
+        self._record_operation(f"{a} / {b} = {result}")
+        return result
+    
+    def power(self, base: float, exponent: float) -> float:
+        """Calculate power."""
+        result = math.pow(base, exponent)
+        self._record_operation(f"{base} ^ {exponent} = {result}")
+        return result
+    
+    def sqrt(self, x: float) -> float:
+        """Calculate square root."""
+        if x < 0:
+            raise ValueError("Cannot calculate square root of negative number")
+        result = math.sqrt(x)
+        self._record_operation(f"sqrt({x}) = {result}")
+        return result
+    
+    def _record_operation(self, operation: str) -> None:
+        """Record operation in history."""
+        self.history.append(operation)
+    
+    def get_history(self) -> List[str]:
+        """Get calculation history."""
+        return self.history.copy()
+    
+    def clear_history(self) -> None:
+        """Clear calculation history."""
+        self.history.clear()
+
+def calculate_statistics(numbers: List[float]) -> dict:
+    """Calculate basic statistics for a list of numbers."""
+    if not numbers:
+        return {"error": "Empty list"}
+    
+    total = sum(numbers)
+    count = len(numbers)
+    mean = total / count
+    
+    # Calculate variance
+    variance = sum((x - mean) ** 2 for x in numbers) / count
+    std_dev = math.sqrt(variance)
+    
+    return {
+        "count": count,
+        "sum": total,
+        "mean": mean,
+        "variance": variance,
+        "std_dev": std_dev,
+        "min": min(numbers),
+        "max": max(numbers)
+    }
@@ -0,0 +1,84 @@
+package com.example.utils;
+
+import java.util.*;
+import java.io.IOException;
+
+/**
+ * A utility class for string operations
+ */
+public class StringUtils {
+    
+    private static final String DEFAULT_DELIMITER = ",";
+    
+    public static boolean isEmpty(String str) {
+        return str == null || str.trim().isEmpty();
+    }
+    
+    public static boolean isNotEmpty(String str) {
+        return !isEmpty(str);
+    }
+    
+    public static String join(List<String> strings, String delimiter) {
+        if (strings == null || strings.isEmpty()) {
+            return "";
+        }
+        
+        if (delimiter == null) {
+            delimiter = DEFAULT_DELIMITER;
+        }
+        
+        StringBuilder result = new StringBuilder();
+        for (int i = 0; i < strings.size(); i++) {
+            if (i > 0) {
+                result.append(delimiter);
+            }
+            result.append(strings.get(i));
+        }
+        
+        return result.toString();
+    }
+    
+    public static List<String> split(String input, String delimiter) {
+        if (isEmpty(input)) {
+            return new ArrayList<>();
+        }
+        
+        if (delimiter == null) {
+            delimiter = DEFAULT_DELIMITER;
+        }
+        
+        return Arrays.asList(input.split(delimiter));
+    }
+    
+    public static String capitalize(String str) {
+        if (isEmpty(str)) {
+            return str;
+        }
+        
+        return str.substring(0, 1).toUpperCase() + str.substring(1).toLowerCase();
+    }
+    
+    public static String reverse(String str) {
+        if (isEmpty(str)) {
+            return str;
+        }
+        
+        return new StringBuilder(str).reverse().toString();
+    }
+    
+    public static int countOccurrences(String text, String substring) {
+        if (isEmpty(text) || isEmpty(substring)) {
+            return 0;
+        }
+        
+        int count = 0;
+        int index = 0;
+        
+        while ((index = text.indexOf(substring, index)) != -1) {
+            count++;
+            index += substring.length();
+        }
+        
+        return count;
+    }
+}
@@ -0,0 +1,77 @@
+/**
+ * User management utilities
+ */
+
+class UserManager {
+    constructor() {
+        this.users = new Map();
+        this.nextId = 1;
+    }
+    
+    addUser(name, email) {
+        if (!name || !email) {
+            throw new Error('Name and email are required');
+        }
+        
+        const user = {
+            id: this.nextId++,
+            name: name,
+            email: email,
+            createdAt: new Date()
+        };
+        
+        this.users.set(user.id, user);
+        return user;
+    }
+    
+    getUser(id) {
+        const user = this.users.get(id);
+        if (!user) {
+            return null;
+        }
+        return { ...user };
+    }
+    
+    updateUser(id, updates) {
+        const user = this.users.get(id);
+        if (!user) {
+            throw new Error('User not found');
+        }
+        
+        Object.assign(user, updates);
+        return { ...user };
+    }
+    
+    deleteUser(id) {
+        return this.users.delete(id);
+    }
+    
+    getAllUsers() {
+        return Array.from(this.users.values());
+    }
+}
+
+function validateEmail(email) {
+    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+    return emailRegex.test(email);
+}
+
+const formatUserName = (firstName, lastName) => {
+    if (!firstName && !lastName) {
+        return 'Anonymous';
+    }
+    return `${firstName || ''} ${lastName || ''}`.trim();
+};
+
+async function fetchUserData(userId) {
+    try {
+        const response = await fetch(`/api/users/${userId}`);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        return await response.json();
+    } catch (error) {
+        console.error('Failed to fetch user data:', error);
+        return null;
+    }
+}
@@ -1,81 +0,0 @@
-import pytest
-import unittest
-from unittest.mock import Mock, patch
-
-# Generated test cases
-
-def test___init___basic():
-    # Arrange
-    self = 'test_value'
-    
-    # Act
-    result = __init__(self)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test___init___param_0():
-    # Arrange
-    self = 'test_value'
-    
-    # Act
-    result = __init__(self)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test___init___edge_null_input():
-    # Test edge case: null_input
-    
-    # Arrange
-    self = None
-    
-    # Act & Assert
-    with pytest.raises((TypeError, ValueError)):
-        __init__(self)
-
-
-def test___init___edge_empty_input():
-    # Test edge case: empty_input
-    
-    # Arrange
-    self = ''
-    
-    # Act
-    result = __init__(self)
-    
-    # Assert
-    # Consider using pytest.raises for exception testing
-    # Add appropriate assertions for edge case
-    assert result is not None or result is None  # Adjust based on expected behavior
-
-
-def test___init___edge_division_by_zero():
-    # Test edge case: division_by_zero
-    
-    # Arrange
-    self = 'test_value'
-    
-    # Act & Assert
-    with pytest.raises(ZeroDivisionError):
-        __init__(self)
-
-
-def test___init___edge_index_error():
-    # Test edge case: index_error
-    
-    # Arrange
-    self = 'test_value'
-    
-    # Act
-    result = __init__(self)
-    
-    # Assert
-    # Consider using pytest.raises for exception testing
-    # Add appropriate assertions for edge case
-    assert result is not None or result is None  # Adjust based on expected behavior
-
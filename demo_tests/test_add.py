@@ -1,121 +0,0 @@
-import pytest
-import unittest
-from unittest.mock import Mock, patch
-
-# Generated test cases
-
-def test_add_basic():
-    # Arrange
-    self = 'test_value'
-    a = 'test_value'
-    b = 'test_value'
-    
-    # Act
-    result = add(self, a, b)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test_add_param_0():
-    # Arrange
-    self = 'test_value'
-    a = 'test_value'
-    b = 'test_value'
-    
-    # Act
-    result = add(self, a, b)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test_add_param_1():
-    # Arrange
-    self = 'test_value'
-    a = 'test_value'
-    b = 'test_value'
-    
-    # Act
-    result = add(self, a, b)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test_add_param_2():
-    # Arrange
-    self = 'test_value'
-    a = 'test_value'
-    b = 'test_value'
-    
-    # Act
-    result = add(self, a, b)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test_add_edge_null_input():
-    # Test edge case: null_input
-    
-    # Arrange
-    self = None
-    a = None
-    b = None
-    
-    # Act & Assert
-    with pytest.raises((TypeError, ValueError)):
-        add(self, a, b)
-
-
-def test_add_edge_empty_input():
-    # Test edge case: empty_input
-    
-    # Arrange
-    self = ''
-    a = ''
-    b = ''
-    
-    # Act
-    result = add(self, a, b)
-    
-    # Assert
-    # Consider using pytest.raises for exception testing
-    # Add appropriate assertions for edge case
-    assert result is not None or result is None  # Adjust based on expected behavior
-
-
-def test_add_edge_division_by_zero():
-    # Test edge case: division_by_zero
-    
-    # Arrange
-    self = 'test_value'
-    a = 'test_value'
-    b = 'test_value'
-    
-    # Act & Assert
-    with pytest.raises(ZeroDivisionError):
-        add(self, a, b)
-
-
-def test_add_edge_index_error():
-    # Test edge case: index_error
-    
-    # Arrange
-    self = 'test_value'
-    a = 'test_value'
-    b = 'test_value'
-    
-    # Act
-    result = add(self, a, b)
-    
-    # Assert
-    # Consider using pytest.raises for exception testing
-    # Add appropriate assertions for edge case
-    assert result is not None or result is None  # Adjust based on expected behavior
-
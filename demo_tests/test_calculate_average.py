@@ -1,81 +1,30 @@
 import pytest
-import unittest
-from unittest.mock import Mock, patch
 
 # Generated test cases
+#
+# Each case calls calculate_average with one argument.
+#   numbers: argument under test
+#   expected_exc: exception type(s) the call must raise, or None
+#   allow_none: whether a None result is acceptable
+
+CASES = [
+    pytest.param(5, None, False, id="basic"),
+    pytest.param([0, 1, -1, 100, -100], None, False, id="param_0"),
+    pytest.param(None, (TypeError, ValueError), False, id="edge_null_input"),
+    pytest.param('', None, True, id="edge_empty_input"),
+    pytest.param(5, ZeroDivisionError, False, id="edge_division_by_zero"),
+    pytest.param(5, None, True, id="edge_index_error"),
+]
+
+
+@pytest.mark.parametrize("numbers,expected_exc,allow_none", CASES)
+def test_calculate_average(numbers, expected_exc, allow_none):
+    if expected_exc is not None:
+        with pytest.raises(expected_exc):
+            calculate_average(numbers)
+        return
 
-def test_calculate_average_basic():
-    # Arrange
-    numbers = 5
-    
-    # Act
     result = calculate_average(numbers)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test_calculate_average_param_0():
-    # Arrange
-    numbers = [0, 1, -1, 100, -100]
-    
-    # Act
-    result = calculate_average(numbers)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test_calculate_average_edge_null_input():
-    # Test edge case: null_input
-    
-    # Arrange
-    numbers = None
-    
-    # Act & Assert
-    with pytest.raises((TypeError, ValueError)):
-        calculate_average(numbers)
-
-
-def test_calculate_average_edge_empty_input():
-    # Test edge case: empty_input
-    
-    # Arrange
-    numbers = ''
-    
-    # Act
-    result = calculate_average(numbers)
-    
-    # Assert
-    # Consider using pytest.raises for exception testing
-    # Add appropriate assertions for edge case
-    assert result is not None or result is None  # Adjust based on expected behavior
-
-
-def test_calculate_average_edge_division_by_zero():
-    # Test edge case: division_by_zero
-    
-    # Arrange
-    numbers = 5
-    
-    # Act & Assert
-    with pytest.raises(ZeroDivisionError):
-        calculate_average(numbers)
-
-
-def test_calculate_average_edge_index_error():
-    # Test edge case: index_error
-    
-    # Arrange
-    numbers = 5
-    
-    # Act
-    result = calculate_average(numbers)
-    
-    # Assert
-    # Consider using pytest.raises for exception testing
-    # Add appropriate assertions for edge case
-    assert result is not None or result is None  # Adjust based on expected behavior
 
+    if not allow_none:
+        assert result is not None
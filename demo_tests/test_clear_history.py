@@ -1,81 +1,30 @@
 import pytest
-import unittest
-from unittest.mock import Mock, patch
 
 # Generated test cases
-
-def test_clear_history_basic():
-    # Arrange
-    self = 'test_value'
-    
-    # Act
-    result = clear_history(self)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test_clear_history_param_0():
-    # Arrange
-    self = 'test_value'
-    
-    # Act
-    result = clear_history(self)
-    
-    # Assert
-    assert result is not None
-    # Add specific assertions based on expected behavior
-
-
-def test_clear_history_edge_null_input():
-    # Test edge case: null_input
-    
-    # Arrange
-    self = None
-    
-    # Act & Assert
-    with pytest.raises((TypeError, ValueError)):
-        clear_history(self)
-
-
-def test_clear_history_edge_empty_input():
-    # Test edge case: empty_input
-    
-    # Arrange
-    self = ''
-    
-    # Act
-    result = clear_history(self)
-    
-    # Assert
-    # Consider using pytest.raises for exception testing
-    # Add appropriate assertions for edge case
-    assert result is not None or result is None  # Adjust based on expected behavior
-
-
-def test_clear_history_edge_division_by_zero():
-    # Test edge case: division_by_zero
-    
-    # Arrange
-    self = 'test_value'
-    
-    # Act & Assert
-    with pytest.raises(ZeroDivisionError):
-        clear_history(self)
-
-
-def test_clear_history_edge_index_error():
-    # Test edge case: index_error
-    
-    # Arrange
-    self = 'test_value'
-    
-    # Act
-    result = clear_history(self)
-    
-    # Assert
-    # Consider using pytest.raises for exception testing
-    # Add appropriate assertions for edge case
-    assert result is not None or result is None  # Adjust based on expected behavior
-
+#
+# Each case calls clear_history with one argument.
+#   value: argument under test
+#   expected_exc: exception type(s) the call must raise, or None
+#   allow_none: whether a None result is acceptable
+
+CASES = [
+    pytest.param('test_value', None, False, id="basic"),
+    pytest.param('test_value', None, False, id="param_0"),
+    pytest.param(None, (TypeError, ValueError), False, id="edge_null_input"),
+    pytest.param('', None, True, id="edge_empty_input"),
+    pytest.param('test_value', ZeroDivisionError, False, id="edge_division_by_zero"),
+    pytest.param('test_value', None, True, id="edge_index_error"),
+]
+
+
+@pytest.mark.parametrize("value,expected_exc,allow_none", CASES)
+def test_clear_history(value, expected_exc, allow_none):
+    if expected_exc is not None:
+        with pytest.raises(expected_exc):
+            clear_history(value)
+        return
+
+    result = clear_history(value)
+
+    if not allow_none:
+        assert result is not None
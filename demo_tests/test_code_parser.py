@@ -2,10 +2,11 @@
 Unit tests for the tree-sitter based code parser.
 """
 import pytest
-import tempfile
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from src.analyzers import code_parser
 from src.analyzers.code_parser import CodeParser, ASTNode
 from src.interfaces.base_interfaces import (
     CodeAnalysis, FunctionInfo, ClassInfo, Parameter,
@@ -13,45 +14,8 @@ from src.interfaces.base_interfaces import (
 )
 
 
-class TestCodeParser:
-    """Test cases for CodeParser class."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = CodeParser()
-    
-    def test_parser_initialization(self):
-        """Test that parser initializes with all supported languages."""
-        expected_languages = ['python', 'javascript', 'typescript', 'java']
-        
-        for lang in expected_languages:
-            assert lang in self.parser.languages
-            assert lang in self.parser.parsers
-    
-    def test_language_detection(self):
-        """Test automatic language detection from file extensions."""
-        test_cases = [
-            ('test.py', 'python'),
-            ('test.js', 'javascript'),
-            ('test.ts', 'typescript'),
-            ('test.jsx', 'javascript'),
-            ('test.tsx', 'typescript'),
-            ('test.java', 'java')
-        ]
-        
-        for filename, expected_lang in test_cases:
-            path = Path(filename)
-            detected_lang = self.parser._detect_language(path)
-            assert detected_lang == expected_lang
-    
-    def test_unsupported_language_detection(self):
-        """Test error handling for unsupported file extensions."""
-        with pytest.raises(ValueError, match="Cannot detect language"):
-            self.parser._detect_language(Path('test.cpp'))
-    
-    def test_parse_python_code(self):
-        """Test parsing Python code into AST."""
-        python_code = '''
+# Source snippets used by the unit tests
+PY_PARSE_SAMPLE = '''
 def hello_world(name):
     """Say hello to someone."""
     return f"Hello, {name}!"
@@ -60,16 +24,8 @@ class Greeter:
     def greet(self, name):
         return hello_world(name)
 '''
-        
-        ast = self.parser.parse_code(python_code, 'python')
-        
-        assert isinstance(ast, ASTNode)
-        assert ast.type == 'module'
-        assert not ast.node.has_error
-    
-    def test_parse_javascript_code(self):
-        """Test parsing JavaScript code into AST."""
-        js_code = '''
+
+JS_PARSE_SAMPLE = '''
 function helloWorld(name) {
     return `Hello, ${name}!`;
 }
@@ -84,16 +40,8 @@ class Greeter {
     }
 }
 '''
-        
-        ast = self.parser.parse_code(js_code, 'javascript')
-        
-        assert isinstance(ast, ASTNode)
-        assert ast.type == 'program'
-        assert not ast.node.has_error
-    
-    def test_parse_java_code(self):
-        """Test parsing Java code into AST."""
-        java_code = '''
+
+JAVA_PARSE_SAMPLE = '''
 public class Greeter {
     public String helloWorld(String name) {
         return "Hello, " + name + "!";
@@ -104,94 +52,16 @@ public class Greeter {
     }
 }
 '''
-        
-        ast = self.parser.parse_code(java_code, 'java')
-        
-        assert isinstance(ast, ASTNode)
-        assert ast.type == 'program'
-        assert not ast.node.has_error
-    
-    def test_identify_python_functions(self):
-        """Test identification of Python functions."""
-        python_code = '''
-def simple_function():
-    pass
 
-def function_with_params(a, b, c=None):
-    """Function with parameters and default value."""
-    return a + b
+PY_TWO_FUNCTIONS = '''
+def first(a):
+    return a + 1
 
-def function_with_type_hints(x: int, y: str) -> str:
-    return f"{x}: {y}"
+def second(b):
+    return b * 2
 '''
-        
-        ast = self.parser.parse_code(python_code, 'python')
-        functions = self.parser.identify_functions(ast)
-        
-        assert len(functions) == 3
-        
-        # Check first function
-        func1 = functions[0]
-        assert func1.name == 'simple_function'
-        assert len(func1.parameters) == 0
-        assert func1.complexity >= 1
-        
-        # Check second function
-        func2 = functions[1]
-        assert func2.name == 'function_with_params'
-        assert len(func2.parameters) == 3
-        assert func2.docstring is not None
-        
-        # Check third function
-        func3 = functions[2]
-        assert func3.name == 'function_with_type_hints'
-        assert len(func3.parameters) == 2
-    
-    def test_identify_python_classes(self):
-        """Test identification of Python classes."""
-        python_code = '''
-class SimpleClass:
-    pass
 
-class ClassWithMethods:
-    def __init__(self):
-        pass
-    
-    def method1(self):
-        return "method1"
-    
-    def method2(self, param):
-        return f"method2: {param}"
-
-class InheritedClass(ClassWithMethods):
-    def method3(self):
-        return "method3"
-'''
-        
-        ast = self.parser.parse_code(python_code, 'python')
-        classes = self.parser.identify_classes(ast)
-        
-        assert len(classes) == 3
-        
-        # Check first class
-        class1 = classes[0]
-        assert class1.name == 'SimpleClass'
-        assert len(class1.methods) == 0
-        
-        # Check second class
-        class2 = classes[1]
-        assert class2.name == 'ClassWithMethods'
-        assert len(class2.methods) == 3  # __init__, method1, method2
-        
-        # Check third class
-        class3 = classes[2]
-        assert class3.name == 'InheritedClass'
-        assert len(class3.methods) == 1  # method3
-        assert 'ClassWithMethods' in class3.inheritance
-    
-    def test_identify_javascript_functions(self):
-        """Test identification of JavaScript functions."""
-        js_code = '''
+JS_FUNCTIONS = '''
 function regularFunction(a, b) {
     return a + b;
 }
@@ -211,20 +81,8 @@ function complexFunction(param1, param2, param3) {
     return param1 + param2;
 }
 '''
-        
-        ast = self.parser.parse_code(js_code, 'javascript')
-        functions = self.parser.identify_functions(ast)
-        
-        assert len(functions) >= 3  # At least the main functions
-        
-        # Find specific functions
-        func_names = [f.name for f in functions]
-        assert 'regularFunction' in func_names
-        assert 'complexFunction' in func_names
-    
-    def test_identify_java_functions(self):
-        """Test identification of Java methods."""
-        java_code = '''
+
+JAVA_METHODS = '''
 public class Calculator {
     public int add(int a, int b) {
         return a + b;
@@ -241,20 +99,8 @@ public class Calculator {
     }
 }
 '''
-        
-        ast = self.parser.parse_code(java_code, 'java')
-        functions = self.parser.identify_functions(ast)
-        
-        assert len(functions) == 3
-        
-        func_names = [f.name for f in functions]
-        assert 'add' in func_names
-        assert 'formatResult' in func_names
-        assert 'main' in func_names
-    
-    def test_detect_python_edge_cases(self):
-        """Test detection of Python edge cases."""
-        python_code = '''
+
+PY_EDGE_CASES = '''
 def risky_function(data, divisor):
     # Division by zero risk
     result = data / divisor
@@ -267,18 +113,8 @@ def risky_function(data, divisor):
     
     return result + first_item + value
 '''
-        
-        ast = self.parser.parse_code(python_code, 'python')
-        edge_cases = self.parser.detect_edge_cases(ast)
-        
-        assert len(edge_cases) > 0
-        
-        edge_types = [ec.type for ec in edge_cases]
-        assert 'division_by_zero' in edge_types or 'index_access' in edge_types
-    
-    def test_detect_javascript_edge_cases(self):
-        """Test detection of JavaScript edge cases."""
-        js_code = '''
+
+JS_EDGE_CASES = '''
 function processData(obj) {
     if (obj === null) {
         return null;
@@ -291,72 +127,30 @@ function processData(obj) {
     return obj.property.value;
 }
 '''
-        
-        ast = self.parser.parse_code(js_code, 'javascript')
-        edge_cases = self.parser.detect_edge_cases(ast)
-        
-        # Should detect null/undefined checks
-        assert len(edge_cases) > 0
-    
-    def test_find_python_dependencies(self):
-        """Test finding Python import dependencies."""
-        python_code = '''
+
+PY_IMPORTS = '''
 import os
 import sys
 from pathlib import Path
 from typing import List, Dict
 import requests
 '''
-        
-        ast = self.parser.parse_code(python_code, 'python')
-        dependencies = self.parser.find_dependencies(ast)
-        
-        assert len(dependencies) > 0
-        
-        dep_names = [dep.name for dep in dependencies]
-        assert 'os' in dep_names
-        assert 'sys' in dep_names
-        assert 'pathlib' in dep_names or 'Path' in dep_names
-    
-    def test_find_javascript_dependencies(self):
-        """Test finding JavaScript import dependencies."""
-        js_code = '''
+
+JS_IMPORTS = '''
 import React from 'react';
 import { useState, useEffect } from 'react';
 import axios from 'axios';
 import './styles.css';
 '''
-        
-        ast = self.parser.parse_code(js_code, 'javascript')
-        dependencies = self.parser.find_dependencies(ast)
-        
-        assert len(dependencies) > 0
-        
-        dep_names = [dep.name for dep in dependencies]
-        assert 'react' in dep_names
-        assert 'axios' in dep_names
-    
-    def test_find_java_dependencies(self):
-        """Test finding Java import dependencies."""
-        java_code = '''
+
+JAVA_IMPORTS = '''
 import java.util.List;
 import java.util.ArrayList;
 import java.io.IOException;
 import com.example.MyClass;
 '''
-        
-        ast = self.parser.parse_code(java_code, 'java')
-        dependencies = self.parser.find_dependencies(ast)
-        
-        assert len(dependencies) > 0
-        
-        dep_names = [dep.name for dep in dependencies]
-        assert any('java.util.List' in name for name in dep_names)
-        assert any('java.util.ArrayList' in name for name in dep_names)
-    
-    def test_analyze_complexity_metrics(self):
-        """Test complexity analysis."""
-        complex_python_code = '''
+
+PY_COMPLEX = '''
 def complex_function(data):
     result = 0
     
@@ -378,18 +172,8 @@ def complex_function(data):
     
     return final_result
 '''
-        
-        ast = self.parser.parse_code(complex_python_code, 'python')
-        complexity = self.parser.analyze_complexity(ast)
-        
-        assert isinstance(complexity, ComplexityMetrics)
-        assert complexity.cyclomatic_complexity > 1
-        assert complexity.lines_of_code > 0
-        assert 0 <= complexity.maintainability_index <= 100
-    
-    def test_analyze_file_with_temp_file(self):
-        """Test analyzing a temporary file."""
-        python_code = '''
+
+PY_FILE_SAMPLE = '''
 def test_function(x, y):
     """Test function for file analysis."""
     return x + y
@@ -398,34 +182,68 @@ class TestClass:
     def test_method(self):
         return "test"
 '''
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(python_code)
-            temp_file_path = f.name
-        
-        try:
-            analysis = self.parser.analyze_file(temp_file_path)
-            
-            assert isinstance(analysis, CodeAnalysis)
-            assert analysis.language == 'python'
-            assert len(analysis.functions) == 2  # test_function and test_method
-            assert len(analysis.classes) == 1
-            func_names = [f.name for f in analysis.functions]
-            assert 'test_function' in func_names
-            assert 'test_method' in func_names
-            assert analysis.classes[0].name == 'TestClass'
-            
-        finally:
-            os.unlink(temp_file_path)
-    
-    def test_analyze_nonexistent_file(self):
-        """Test error handling for nonexistent files."""
-        with pytest.raises(FileNotFoundError):
-            self.parser.analyze_file('nonexistent_file.py')
+
+PY_TRAVERSE_SAMPLE = '''
+def func1():
+    pass
+
+def func2():
+    pass
+'''
+
+PY_INVALID_SYNTAX = '''
+def broken_function(
+    # Missing closing parenthesis and colon
+    return "this won't parse"
+'''
+
+
+# Python snippets analyzed with a single parse each, with the expected results
+PYTHON_ANALYSIS_CASES = [
+    pytest.param('''
+def simple_function():
+    pass
+
+def function_with_params(a, b, c=None):
+    """Function with parameters and default value."""
+    return a + b
+
+def function_with_type_hints(x: int, y: str) -> str:
+    return f"{x}: {y}"
+''', {
+        'functions': [('simple_function', 0), ('function_with_params', 3), ('function_with_type_hints', 2)],
+        'docstrings': ['function_with_params'],
+    }, id="functions"),
+    pytest.param('''
+class SimpleClass:
+    pass
+
+class ClassWithMethods:
+    def __init__(self):
+        pass
     
-    def test_analyze_code_comprehensive(self):
-        """Test comprehensive code analysis."""
-        python_code = '''
+    def method1(self):
+        return "method1"
+    
+    def method2(self, param):
+        return f"method2: {param}"
+
+class InheritedClass(ClassWithMethods):
+    def method3(self):
+        return "method3"
+''', {
+        'functions': [('__init__', 1), ('method1', 1), ('method2', 2), ('method3', 1)],
+        'classes': [('SimpleClass', 0), ('ClassWithMethods', 3), ('InheritedClass', 1)],
+        'inherits': {'InheritedClass': 'ClassWithMethods'},
+    }, id="classes"),
+    pytest.param('''
+def function_with_defaults(a, b=10, c="default", d=None):
+    return a + b
+''', {
+        'functions': [('function_with_defaults', 4)],
+        'params': {'function_with_defaults': ['a', 'b', 'c', 'd']},
+    }, id="parameter_defaults"),
+    pytest.param('''
 import os
 from typing import List
 
@@ -452,44 +270,269 @@ class Calculator:
         result = a / b
         self.history.append(f"{a} / {b} = {result}")
         return result
-'''
+''', {
+        'functions': [('calculate_average', 1), ('__init__', 1), ('add', 3), ('divide', 3)],
+        'classes': [('Calculator', 3)],
+        'dependencies': ['os'],
+        'edge_cases': True,
+    }, id="comprehensive"),
+]
+
+
+class TestCodeParser:
+    """Test cases for CodeParser class."""
+    
+    def test_parser_initialization(self, shared_parser):
+        """Test that parser initializes with all supported languages."""
+        expected_languages = ['python', 'javascript', 'typescript', 'java']
         
-        analysis = self.parser.analyze_code(python_code, 'python')
+        for lang in expected_languages:
+            assert lang in shared_parser.languages
+    
+    def test_parsers_are_per_thread(self, shared_parser):
+        """Test that each thread gets its own tree-sitter parsers."""
+        other = {}
         
-        # Verify analysis structure
-        assert isinstance(analysis, CodeAnalysis)
-        assert analysis.language == 'python'
+        def parse_in_worker():
+            code_parser.get_parser('python')
+            other.update(shared_parser.parsers)
         
-        # Check functions
-        assert len(analysis.functions) == 4  # calculate_average, __init__, add, divide
-        func_names = [f.name for f in analysis.functions]
-        assert 'calculate_average' in func_names
-        assert '__init__' in func_names
-        assert 'add' in func_names
-        assert 'divide' in func_names
+        worker = threading.Thread(target=parse_in_worker)
+        worker.start()
+        worker.join()
         
-        # Check classes
-        assert len(analysis.classes) == 1
-        assert analysis.classes[0].name == 'Calculator'
-        assert len(analysis.classes[0].methods) == 3  # __init__, add, divide
+        parser = code_parser.get_parser('python')
+        assert other['python'] is not parser
+        assert shared_parser.parsers['python'] is parser
+        assert CodeParser().parsers['python'] is parser
+    
+    def test_grammars_load_on_first_use(self, monkeypatch):
+        """Test that a grammar is only loaded once its language is parsed."""
+        monkeypatch.setattr(code_parser, '_LANGUAGES', {})
+        monkeypatch.setattr(code_parser, '_QUERIES', {})
+        monkeypatch.setattr(code_parser, '_thread_parsers', threading.local())
         
-        # Check dependencies
-        assert len(analysis.dependencies) > 0
-        dep_names = [dep.name for dep in analysis.dependencies]
-        assert 'os' in dep_names
+        parser = CodeParser()
+        assert 'java' in parser.languages
+        assert code_parser._LANGUAGES == {}
         
-        # Check edge cases
-        assert len(analysis.edge_cases) > 0
+        parser.analyze_code(PY_PARSE_SAMPLE, 'python')
+        assert set(code_parser._LANGUAGES) == {'python'}
+    
+    def test_language_detection(self, shared_parser):
+        """Test automatic language detection from file extensions."""
+        test_cases = [
+            ('.py', 'python'),
+            ('.js', 'javascript'),
+            ('.ts', 'typescript'),
+            ('.jsx', 'javascript'),
+            ('.tsx', 'typescript'),
+            ('.java', 'java'),
+            ('.PY', 'python'),
+        ]
         
-        # Check complexity metrics
-        assert isinstance(analysis.complexity_metrics, ComplexityMetrics)
-        assert analysis.complexity_metrics.cyclomatic_complexity > 0
+        for suffix, expected_lang in test_cases:
+            assert shared_parser._detect_language_from_suffix(suffix) == expected_lang
+        
+        assert shared_parser._detect_language(Path('src/test.java')) == 'java'
     
-    def test_ast_node_properties(self):
+    def test_unsupported_language_detection(self, shared_parser):
+        """Test error handling for unsupported file extensions."""
+        with pytest.raises(ValueError, match="Cannot detect language"):
+            shared_parser._detect_language(Path('test.cpp'))
+    
+    def test_parse_python_code(self, shared_parser):
+        """Test parsing Python code into AST."""
+        ast = shared_parser.parse_code(PY_PARSE_SAMPLE, 'python')
+        
+        assert isinstance(ast, ASTNode)
+        assert ast.type == 'module'
+        assert not ast.node.has_error
+    
+    def test_parse_javascript_code(self, shared_parser):
+        """Test parsing JavaScript code into AST."""
+        ast = shared_parser.parse_code(JS_PARSE_SAMPLE, 'javascript')
+        
+        assert isinstance(ast, ASTNode)
+        assert ast.type == 'program'
+        assert not ast.node.has_error
+    
+    def test_parse_java_code(self, shared_parser):
+        """Test parsing Java code into AST."""
+        ast = shared_parser.parse_code(JAVA_PARSE_SAMPLE, 'java')
+
+        assert isinstance(ast, ASTNode)
+        assert ast.type == 'program'
+        assert not ast.node.has_error
+
+    def test_parse_bytes_matches_str(self, shared_parser):
+        """Test that UTF-8 bytes parse to the same tree as the equivalent string."""
+        python_code = 'def greet(name):\n    return "héllo " + name\n'
+
+        from_bytes = shared_parser.parse_code(python_code.encode('utf-8'), 'python')
+
+        assert from_bytes.source_code == python_code
+        assert str(from_bytes.node) == str(shared_parser.parse_code(python_code, 'python').node)
+        assert [f.name for f in shared_parser.identify_functions(from_bytes)] == ['greet']
+
+    def test_incremental_reparse_matches_fresh_parse(self, shared_parser):
+        """Test that reparsing edited code reuses the previous tree correctly."""
+        edited_code = PY_TWO_FUNCTIONS.replace('return a + 1', 'if a:\n        return a + 1\n    return 0')
+
+        original = shared_parser.parse_code(PY_TWO_FUNCTIONS, 'python')
+        original_sexp = str(original.node)
+        edited = shared_parser.parse_code(edited_code, 'python')
+
+        assert str(edited.node) == str(CodeParser().parse_code(edited_code, 'python').node)
+        # The previously returned tree is left untouched by the edit
+        assert str(original.node) == original_sexp
+        assert [f.name for f in shared_parser.identify_functions(edited)] == ['first', 'second']
+
+    def test_reparse_applies_caller_edit(self, shared_parser):
+        """Test that reparse with a known edit matches a fresh parse and only changes the edited span."""
+        previous = shared_parser.parse_code(PY_TWO_FUNCTIONS, 'python')
+        start = PY_TWO_FUNCTIONS.index('1')
+        edited_code = PY_TWO_FUNCTIONS[:start] + '10' + PY_TWO_FUNCTIONS[start + 1:]
+        edit = dict(
+            start_byte=start, old_end_byte=start + 1, new_end_byte=start + 2,
+            start_point=(2, 15), old_end_point=(2, 16), new_end_point=(2, 17),
+        )
+        
+        reparsed = shared_parser.reparse(edited_code, previous, **edit)
+        
+        assert str(reparsed.node) == str(CodeParser().parse_code(edited_code, 'python').node)
+        assert reparsed.source_code == edited_code
+        edited_tree = previous.tree.copy()
+        edited_tree.edit(**edit)
+        changed = reparsed.tree.changed_ranges(edited_tree)
+        assert all(r.start_byte >= start and r.end_byte <= start + 2 for r in changed)
+        # The caller's tree is left untouched by the edit
+        assert previous.source_code == PY_TWO_FUNCTIONS
+        assert not previous.tree.root_node.has_changes
+    
+    def test_parse_cache_reuses_tree_for_same_source(self, shared_parser):
+        """Test that identical source is parsed once until the cache is cleared."""
+        python_code = 'def add(a, b):\n    return a + b\n'
+
+        first = shared_parser.parse_code(python_code, 'python')
+        second = shared_parser.parse_code(python_code, 'python')
+        assert second.node == first.node
+
+        shared_parser.clear_cache()
+        third = shared_parser.parse_code(python_code, 'python')
+        assert third.node != first.node
+        assert str(third.node) == str(first.node)
+
+    def test_identify_javascript_functions(self, shared_parser):
+        """Test identification of JavaScript functions."""
+        ast = shared_parser.parse_code(JS_FUNCTIONS, 'javascript')
+        functions = shared_parser.identify_functions(ast)
+        
+        assert len(functions) >= 3  # At least the main functions
+        
+        # Find specific functions
+        func_names = {f.name for f in functions}
+        assert {'regularFunction', 'complexFunction'} <= func_names
+    
+    def test_identify_java_functions(self, shared_parser):
+        """Test identification of Java methods."""
+        ast = shared_parser.parse_code(JAVA_METHODS, 'java')
+        functions = shared_parser.identify_functions(ast)
+        
+        assert len(functions) == 3
+        
+        func_names = {f.name for f in functions}
+        assert {'add', 'formatResult', 'main'} <= func_names
+    
+    def test_detect_python_edge_cases(self, shared_parser):
+        """Test detection of Python edge cases."""
+        ast = shared_parser.parse_code(PY_EDGE_CASES, 'python')
+        edge_cases = shared_parser.detect_edge_cases(ast)
+        
+        assert len(edge_cases) > 0
+        
+        edge_types = [ec.type for ec in edge_cases]
+        assert 'division_by_zero' in edge_types or 'index_access' in edge_types
+    
+    def test_detect_javascript_edge_cases(self, shared_parser):
+        """Test detection of JavaScript edge cases."""
+        ast = shared_parser.parse_code(JS_EDGE_CASES, 'javascript')
+        edge_cases = shared_parser.detect_edge_cases(ast)
+        
+        # Should detect null/undefined checks
+        assert len(edge_cases) > 0
+    
+    def test_find_python_dependencies(self, shared_parser):
+        """Test finding Python import dependencies."""
+        ast = shared_parser.parse_code(PY_IMPORTS, 'python')
+        dependencies = shared_parser.find_dependencies(ast)
+        
+        assert len(dependencies) > 0
+        
+        dep_names = {dep.name for dep in dependencies}
+        assert {'os', 'sys'} <= dep_names
+        assert dep_names & {'pathlib', 'Path'}
+    
+    def test_find_javascript_dependencies(self, shared_parser):
+        """Test finding JavaScript import dependencies."""
+        ast = shared_parser.parse_code(JS_IMPORTS, 'javascript')
+        dependencies = shared_parser.find_dependencies(ast)
+        
+        assert len(dependencies) > 0
+        
+        dep_names = {dep.name for dep in dependencies}
+        assert {'react', 'axios'} <= dep_names
+    
+    def test_find_java_dependencies(self, shared_parser):
+        """Test finding Java import dependencies."""
+        ast = shared_parser.parse_code(JAVA_IMPORTS, 'java')
+        dependencies = shared_parser.find_dependencies(ast)
+        
+        assert len(dependencies) > 0
+        
+        dep_names = [dep.name for dep in dependencies]
+        assert any('java.util.List' in name for name in dep_names)
+        assert any('java.util.ArrayList' in name for name in dep_names)
+    
+    def test_analyze_complexity_metrics(self, shared_parser):
+        """Test complexity analysis."""
+        ast = shared_parser.parse_code(PY_COMPLEX, 'python')
+        complexity = shared_parser.analyze_complexity(ast)
+        
+        assert isinstance(complexity, ComplexityMetrics)
+        assert complexity.cyclomatic_complexity > 1
+        assert complexity.lines_of_code > 0
+        assert 0 <= complexity.maintainability_index <= 100
+    
+    def test_analyze_complexity_without_language(self, shared_parser):
+        """Test complexity analysis of a bare ASTNode whose language is unknown."""
+        ast = shared_parser.parse_code(PY_COMPLEX, 'python')
+        bare = ASTNode(ast.node, ast.source_code)
+        
+        assert shared_parser.analyze_complexity(bare) == shared_parser.analyze_complexity(ast)
+    
+    def test_analyze_file_text(self, shared_parser):
+        """Test analyzing file contents with the language taken from the file name."""
+        analysis = shared_parser.analyze_file_text(PY_FILE_SAMPLE, 'test.py')
+        
+        assert isinstance(analysis, CodeAnalysis)
+        assert analysis.language == 'python'
+        assert len(analysis.functions) == 2  # test_function and test_method
+        assert len(analysis.classes) == 1
+        func_names = {f.name for f in analysis.functions}
+        assert {'test_function', 'test_method'} <= func_names
+        assert analysis.classes[0].name == 'TestClass'
+    
+    def test_analyze_nonexistent_file(self, shared_parser):
+        """Test error handling for nonexistent files."""
+        with pytest.raises(FileNotFoundError):
+            shared_parser.analyze_file('nonexistent_file.py')
+    
+    def test_ast_node_properties(self, shared_parser):
         """Test ASTNode wrapper properties."""
         python_code = 'def test(): pass'
         
-        ast = self.parser.parse_code(python_code, 'python')
+        ast = shared_parser.parse_code(python_code, 'python')
         
         assert ast.text == python_code
         assert ast.type == 'module'
@@ -498,151 +541,101 @@ class Calculator:
         assert len(ast.start_point) == 2  # (row, column)
         assert len(ast.end_point) == 2
     
-    def test_traverse_ast_functionality(self):
+    def test_traverse_ast_functionality(self, shared_parser):
         """Test AST traversal functionality."""
-        python_code = '''
-def func1():
-    pass
-
-def func2():
-    pass
-'''
-        
-        ast = self.parser.parse_code(python_code, 'python')
-        function_nodes = self.parser._traverse_ast(ast.node, ast.source_code, 'function_definition')
+        ast = shared_parser.parse_code(PY_TRAVERSE_SAMPLE, 'python')
+        function_nodes = shared_parser._traverse_ast(ast.node, ast.source_code, 'function_definition')
         
         assert len(function_nodes) == 2
-        assert all(isinstance(node, ASTNode) for node in function_nodes)
-        assert all(node.type == 'function_definition' for node in function_nodes)
+        # _traverse_ast is annotated -> List[ASTNode] and only builds ASTNode, so one check covers the list
+        assert isinstance(function_nodes[0], ASTNode)
+        assert [node.type for node in function_nodes] == ['function_definition', 'function_definition']
     
-    def test_error_handling_invalid_syntax(self):
-        """Test handling of code with syntax errors."""
-        invalid_python = '''
-def broken_function(
-    # Missing closing parenthesis and colon
-    return "this won't parse"
-'''
+    def test_traverse_ast_handles_deep_nesting(self, shared_parser):
+        """Test that traversal of trees deeper than the recursion limit does not recurse."""
+        depth = 3000
+        ast = shared_parser.parse_code('x = ' + '[' * depth + ']' * depth + '\n', 'python')
+        
+        list_nodes = shared_parser._traverse_ast(ast.node, ast.source_code, 'list')
         
+        assert len(list_nodes) == depth
+    
+    def test_analyze_all_matches_analyze_code(self, shared_parser):
+        """Test that analyze_all on a parsed tree gives the analyze_code result from one index."""
+        ast = shared_parser.parse_code(PY_COMPLEX, 'python')
+        
+        analysis = shared_parser.analyze_all(ast)
+        
+        assert analysis == shared_parser.analyze_code(PY_COMPLEX, 'python')
+        index = ast._nodes_by_type
+        assert index is not None
+        shared_parser.identify_functions(ast)
+        assert ast._nodes_by_type is index
+    
+    def test_error_handling_invalid_syntax(self, shared_parser):
+        """Test handling of code with syntax errors."""
         # Should still create AST but with errors
-        ast = self.parser.parse_code(invalid_python, 'python')
+        ast = shared_parser.parse_code(PY_INVALID_SYNTAX, 'python')
         assert ast.node.has_error
     
-    def test_parameter_extraction_with_defaults(self):
-        """Test extraction of function parameters with default values."""
-        python_code = '''
-def function_with_defaults(a, b=10, c="default", d=None):
-    return a + b
-'''
+    @pytest.mark.parametrize("python_code, expected", PYTHON_ANALYSIS_CASES)
+    def test_analyze_python_snippet(self, shared_parser, python_code, expected):
+        """Test functions, classes, dependencies, edge cases and complexity from one parse."""
+        analysis = shared_parser.analyze_code(python_code, 'python')
+        
+        assert isinstance(analysis, CodeAnalysis)
+        assert analysis.language == 'python'
+        
+        functions = {f.name: f for f in analysis.functions}
+        assert [(f.name, len(f.parameters)) for f in analysis.functions] == expected['functions']
+        assert all(f.complexity >= 1 for f in analysis.functions)
+        for name in expected.get('docstrings', []):
+            assert functions[name].docstring is not None
+        for name, param_names in expected.get('params', {}).items():
+            assert [p.name for p in functions[name].parameters] == param_names
+        
+        classes = {c.name: c for c in analysis.classes}
+        assert [(c.name, len(c.methods)) for c in analysis.classes] == expected.get('classes', [])
+        for name, base in expected.get('inherits', {}).items():
+            assert base in classes[name].inheritance
         
-        ast = self.parser.parse_code(python_code, 'python')
-        functions = self.parser.identify_functions(ast)
+        dep_names = {dep.name for dep in analysis.dependencies}
+        assert set(expected.get('dependencies', [])) <= dep_names
         
-        assert len(functions) == 1
-        func = functions[0]
-        assert func.name == 'function_with_defaults'
-        assert len(func.parameters) == 4
+        if expected.get('edge_cases'):
+            assert len(analysis.edge_cases) > 0
         
-        param_names = [p.name for p in func.parameters]
-        assert 'a' in param_names
-        assert 'b' in param_names
-        assert 'c' in param_names
-        assert 'd' in param_names
+        assert isinstance(analysis.complexity_metrics, ComplexityMetrics)
+        assert analysis.complexity_metrics.cyclomatic_complexity > 0
+
+
+@pytest.fixture(scope="module")
+def real_module_analyses(load_fixture):
+    """Analyses of the realistic modules keyed by language, run concurrently.
+
+    The modules are read from ``demo_tests/fixtures``. Tree-sitter parsers
+    are kept per thread, so each module is analyzed by its own CodeParser
+    on its own worker.
+    """
+    sources = {
+        'python': load_fixture('calculator.py'),
+        'javascript': load_fixture('user_manager.js'),
+        'java': load_fixture('string_utils.java'),
+    }
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        futures = {
+            language: pool.submit(CodeParser().analyze_code, code, language)
+            for language, code in sources.items()
+        }
+        return {language: future.result() for language, future in futures.items()}
 
 
 class TestCodeParserIntegration:
     """Integration tests for CodeParser with real code examples."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = CodeParser()
-    
-    def test_analyze_real_python_module(self):
+    def test_analyze_real_python_module(self, real_module_analyses):
         """Test analysis of a realistic Python module."""
-        python_module = '''
-"""
-A sample calculator module for testing.
-"""
-import math
-from typing import List, Optional
-
-class ScientificCalculator:
-    """A calculator with scientific functions."""
-    
-    def __init__(self):
-        self.memory = 0.0
-        self.history: List[str] = []
-    
-    def add(self, a: float, b: float) -> float:
-        """Add two numbers."""
-        result = a + b
-        self._record_operation(f"{a} + {b} = {result}")
-        return result
-    
-    def multiply(self, a: float, b: float) -> float:
-        """Multiply two numbers."""
-        result = a * b
-        self._record_operation(f"{a} * {b} = {result}")
-        return result
-    
-    def divide(self, a: float, b: float) -> float:
-        """Divide two numbers."""
-        if b == 0:
-            raise ValueError("Division by zero")
-        result = a / b
-        self._record_operation(f"{a} / {b} = {result}")
-        return result
-    
-    def power(self, base: float, exponent: float) -> float:
-        """Calculate power."""
-        result = math.pow(base, exponent)
-        self._record_operation(f"{base} ^ {exponent} = {result}")
-        return result
-    
-    def sqrt(self, x: float) -> float:
-        """Calculate square root."""
-        if x < 0:
-            raise ValueError("Cannot calculate square root of negative number")
-        result = math.sqrt(x)
-        self._record_operation(f"sqrt({x}) = {result}")
-        return result
-    
-    def _record_operation(self, operation: str) -> None:
-        """Record operation in history."""
-        self.history.append(operation)
-    
-    def get_history(self) -> List[str]:
-        """Get calculation history."""
-        return self.history.copy()
-    
-    def clear_history(self) -> None:
-        """Clear calculation history."""
-        self.history.clear()
-
-def calculate_statistics(numbers: List[float]) -> dict:
-    """Calculate basic statistics for a list of numbers."""
-    if not numbers:
-        return {"error": "Empty list"}
-    
-    total = sum(numbers)
-    count = len(numbers)
-    mean = total / count
-    
-    # Calculate variance
-    variance = sum((x - mean) ** 2 for x in numbers) / count
-    std_dev = math.sqrt(variance)
-    
-    return {
-        "count": count,
-        "sum": total,
-        "mean": mean,
-        "variance": variance,
-        "std_dev": std_dev,
-        "min": min(numbers),
-        "max": max(numbers)
-    }
-'''
-        
-        analysis = self.parser.analyze_code(python_module, 'python')
+        analysis = real_module_analyses['python']
         
         # Verify comprehensive analysis
         assert analysis.language == 'python'
@@ -657,7 +650,7 @@ def calculate_statistics(numbers: List[float]) -> dict:
         assert len(calc_class.methods) >= 7
         
         # Check dependencies
-        dep_names = [dep.name for dep in analysis.dependencies]
+        dep_names = {dep.name for dep in analysis.dependencies}
         assert 'math' in dep_names
         
         # Check edge cases (division by zero, negative sqrt, etc.)
@@ -667,89 +660,9 @@ def calculate_statistics(numbers: List[float]) -> dict:
         assert analysis.complexity_metrics.cyclomatic_complexity > 1
         assert analysis.complexity_metrics.lines_of_code > 50
     
-    def test_analyze_real_javascript_module(self):
+    def test_analyze_real_javascript_module(self, real_module_analyses):
         """Test analysis of a realistic JavaScript module."""
-        js_module = '''
-/**
- * User management utilities
- */
-
-class UserManager {
-    constructor() {
-        this.users = new Map();
-        this.nextId = 1;
-    }
-    
-    addUser(name, email) {
-        if (!name || !email) {
-            throw new Error('Name and email are required');
-        }
-        
-        const user = {
-            id: this.nextId++,
-            name: name,
-            email: email,
-            createdAt: new Date()
-        };
-        
-        this.users.set(user.id, user);
-        return user;
-    }
-    
-    getUser(id) {
-        const user = this.users.get(id);
-        if (!user) {
-            return null;
-        }
-        return { ...user };
-    }
-    
-    updateUser(id, updates) {
-        const user = this.users.get(id);
-        if (!user) {
-            throw new Error('User not found');
-        }
-        
-        Object.assign(user, updates);
-        return { ...user };
-    }
-    
-    deleteUser(id) {
-        return this.users.delete(id);
-    }
-    
-    getAllUsers() {
-        return Array.from(this.users.values());
-    }
-}
-
-function validateEmail(email) {
-    const emailRegex = /^[^\\s@]+@[^\\s@]+\\.[^\\s@]+$/;
-    return emailRegex.test(email);
-}
-
-const formatUserName = (firstName, lastName) => {
-    if (!firstName && !lastName) {
-        return 'Anonymous';
-    }
-    return `${firstName || ''} ${lastName || ''}`.trim();
-};
-
-async function fetchUserData(userId) {
-    try {
-        const response = await fetch(`/api/users/${userId}`);
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        return await response.json();
-    } catch (error) {
-        console.error('Failed to fetch user data:', error);
-        return null;
-    }
-}
-'''
-        
-        analysis = self.parser.analyze_code(js_module, 'javascript')
+        analysis = real_module_analyses['javascript']
         
         # Verify analysis
         assert analysis.language == 'javascript'
@@ -765,106 +678,17 @@ async function fetchUserData(userId) {
         # Check edge cases (null checks, error handling)
         assert len(analysis.edge_cases) > 0
     
-    def test_analyze_real_java_class(self):
+    def test_analyze_real_java_class(self, real_module_analyses):
         """Test analysis of a realistic Java class."""
-        java_class = '''
-package com.example.utils;
-
-import java.util.*;
-import java.io.IOException;
-
-/**
- * A utility class for string operations
- */
-public class StringUtils {
-    
-    private static final String DEFAULT_DELIMITER = ",";
-    
-    public static boolean isEmpty(String str) {
-        return str == null || str.trim().isEmpty();
-    }
-    
-    public static boolean isNotEmpty(String str) {
-        return !isEmpty(str);
-    }
-    
-    public static String join(List<String> strings, String delimiter) {
-        if (strings == null || strings.isEmpty()) {
-            return "";
-        }
-        
-        if (delimiter == null) {
-            delimiter = DEFAULT_DELIMITER;
-        }
-        
-        StringBuilder result = new StringBuilder();
-        for (int i = 0; i < strings.size(); i++) {
-            if (i > 0) {
-                result.append(delimiter);
-            }
-            result.append(strings.get(i));
-        }
-        
-        return result.toString();
-    }
-    
-    public static List<String> split(String input, String delimiter) {
-        if (isEmpty(input)) {
-            return new ArrayList<>();
-        }
-        
-        if (delimiter == null) {
-            delimiter = DEFAULT_DELIMITER;
-        }
-        
-        return Arrays.asList(input.split(delimiter));
-    }
-    
-    public static String capitalize(String str) {
-        if (isEmpty(str)) {
-            return str;
-        }
-        
-        return str.substring(0, 1).toUpperCase() + str.substring(1).toLowerCase();
-    }
-    
-    public static String reverse(String str) {
-        if (isEmpty(str)) {
-            return str;
-        }
-        
-        return new StringBuilder(str).reverse().toString();
-    }
-    
-    public static int countOccurrences(String text, String substring) {
-        if (isEmpty(text) || isEmpty(substring)) {
-            return 0;
-        }
-        
-        int count = 0;
-        int index = 0;
-        
-        while ((index = text.indexOf(substring, index)) != -1) {
-            count++;
-            index += substring.length();
-        }
-        
-        return count;
-    }
-}
-'''
-        
-        analysis = self.parser.analyze_code(java_class, 'java')
+        analysis = real_module_analyses['java']
         
         # Verify analysis
         assert analysis.language == 'java'
         
         # Check methods
         assert len(analysis.functions) >= 7
-        method_names = [f.name for f in analysis.functions]
-        assert 'isEmpty' in method_names
-        assert 'join' in method_names
-        assert 'split' in method_names
+        method_names = {f.name for f in analysis.functions}
+        assert {'isEmpty', 'join', 'split'} <= method_names
         
         # Check classes
         assert len(analysis.classes) == 1
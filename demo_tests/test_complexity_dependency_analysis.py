@@ -33,7 +33,23 @@ def simple_function(x):
         assert metrics.cyclomatic_complexity >= 2  # if statement adds complexity
         assert metrics.lines_of_code > 0
         assert 0 <= metrics.maintainability_index <= 100
-    
+
+    def test_text_based_analysis_is_memoized(self):
+        """Test that repeated text-based analysis reuses cached metrics."""
+        code = """
+def repeated(x):
+    while x > 0:
+        x -= 1
+    return x
+"""
+        first = self.analyzer.analyze(code)
+        hits_before = ComplexityAnalyzer._text_metrics.cache_info().hits
+        second = ComplexityAnalyzer().analyze(code)
+
+        assert ComplexityAnalyzer._text_metrics.cache_info().hits == hits_before + 1
+        assert second == first
+        assert second is not first  # callers get their own metrics object
+
     def test_cyclomatic_complexity_calculation(self):
         """Test cyclomatic complexity calculation with various control structures."""
         # Simple function with multiple decision points
@@ -348,7 +348,40 @@ def complex_function(data, threshold=10):
         error_template = self.detector._generate_test_template(error_gap, "Test error")
         assert "error_handling" in error_template
         assert "pytest.raises" in error_template
-    
+
+    def test_generate_test_template_nested_loops(self):
+        """Test that templates for nested-loop functions suggest small inputs."""
+        nested_gap = DetailedCoverageGap(
+            function_name="matrix_func",
+            line_range=(1, 5),
+            description="Nested loops",
+            suggested_tests=["Add unit test"],
+            gap_type=GapType.UNTESTED_FUNCTION,
+            severity=GapSeverity.HIGH,
+            confidence=1.0,
+            code_snippet=(
+                "def matrix_func(matrix):\n"
+                "    for row in matrix:\n"
+                "        for value in row:\n"
+                "            total += value\n"
+                "    for value in matrix[0]:\n"
+                "        pass"
+            ),
+            suggested_test_types=[TestType.UNIT],
+            priority=8
+        )
+
+        assert self.detector._loop_nesting_depth(nested_gap.code_snippet) == 2
+        template = self.detector._generate_test_template(nested_gap, "Add unit test")
+        assert "nested 2 deep" in template
+        assert "size = 3" in template
+
+        flat_template = self.detector._generate_test_template(
+            DetailedCoverageGap(**{**nested_gap.__dict__, 'code_snippet': "def f(): pass"}),
+            "Add unit test"
+        )
+        assert "size = 3" not in flat_template
+
     def test_language_specific_patterns(self):
         """Test language-specific pattern detection."""
         # Test Java patterns
@@ -429,7 +462,15 @@ def complex_function(data, threshold=10):
             # If same severity, priority should be higher or equal
             if current_gap.severity == next_gap.severity:
                 assert current_gap.priority >= next_gap.priority
-    
+
+    def test_severity_ordering(self):
+        """Test that severities sort from most to least severe."""
+        severities = [GapSeverity.LOW, GapSeverity.CRITICAL, GapSeverity.MEDIUM, GapSeverity.HIGH]
+
+        assert sorted(severities) == [
+            GapSeverity.CRITICAL, GapSeverity.HIGH, GapSeverity.MEDIUM, GapSeverity.LOW
+        ]
+
     def test_confidence_scoring(self):
         """Test that confidence scores are appropriate for different gap types."""
         gaps = self.detector.detect_coverage_gaps(
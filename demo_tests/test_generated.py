@@ -0,0 +1,40 @@
+import pytest
+
+# Generated test cases
+#
+# Each case calls its target through a lambda so that a missing target fails
+# that case instead of the whole module.
+#   fn: callable under test
+#   args: positional arguments
+#   expected_exc: exception type(s) the call must raise, or None
+#   allow_none: whether a None result is acceptable
+
+CASES = [
+    pytest.param(lambda *a: __init__(*a), ('test_value',), None, False, id="__init___basic"),
+    pytest.param(lambda *a: __init__(*a), ('test_value',), None, False, id="__init___param_0"),
+    pytest.param(lambda *a: __init__(*a), (None,), (TypeError, ValueError), False, id="__init___edge_null_input"),
+    pytest.param(lambda *a: __init__(*a), ('',), None, True, id="__init___edge_empty_input"),
+    pytest.param(lambda *a: __init__(*a), ('test_value',), ZeroDivisionError, False, id="__init___edge_division_by_zero"),
+    pytest.param(lambda *a: __init__(*a), ('test_value',), None, True, id="__init___edge_index_error"),
+    pytest.param(lambda *a: add(*a), ('test_value', 'test_value', 'test_value'), None, False, id="add_basic"),
+    pytest.param(lambda *a: add(*a), ('test_value', 'test_value', 'test_value'), None, False, id="add_param_0"),
+    pytest.param(lambda *a: add(*a), ('test_value', 'test_value', 'test_value'), None, False, id="add_param_1"),
+    pytest.param(lambda *a: add(*a), ('test_value', 'test_value', 'test_value'), None, False, id="add_param_2"),
+    pytest.param(lambda *a: add(*a), (None, None, None), (TypeError, ValueError), False, id="add_edge_null_input"),
+    pytest.param(lambda *a: add(*a), ('', '', ''), None, True, id="add_edge_empty_input"),
+    pytest.param(lambda *a: add(*a), ('test_value', 'test_value', 'test_value'), ZeroDivisionError, False, id="add_edge_division_by_zero"),
+    pytest.param(lambda *a: add(*a), ('test_value', 'test_value', 'test_value'), None, True, id="add_edge_index_error"),
+]
+
+
+@pytest.mark.parametrize("fn,args,expected_exc,allow_none", CASES)
+def test_case(fn, args, expected_exc, allow_none):
+    if expected_exc is not None:
+        with pytest.raises(expected_exc):
+            fn(*args)
+        return
+
+    result = fn(*args)
+
+    if not allow_none:
+        assert result is not None
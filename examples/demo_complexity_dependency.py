@@ -3,17 +3,20 @@
 Demo script showcasing enhanced complexity and dependency analysis capabilities.
 """
 
-from src.analyzers.complexity_analyzer import ComplexityAnalyzer
-from src.analyzers.dependency_analyzer import DependencyAnalyzer
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 
 def demo_complexity_analysis():
     """Demonstrate complexity analysis capabilities."""
+    from src.analyzers.analyzer_cache import get_complexity_analyzer
+
     print("=" * 60)
     print("COMPLEXITY ANALYSIS DEMO")
     print("=" * 60)
     
-    analyzer = ComplexityAnalyzer()
+    analyzer = get_complexity_analyzer()
     
     # Simple function
     simple_code = """
@@ -88,13 +91,20 @@ def factorial(n):
     print(f"   Simple vs Complex Maintainability: {simple_metrics.maintainability_index} vs {complex_metrics.maintainability_index}")
 
 
+def _format_dependencies(deps):
+    """Render one line per dependency so a block can be written in one call."""
+    return "".join(f"   {dep.name} ({dep.type})\n" for dep in deps)
+
+
 def demo_dependency_analysis():
     """Demonstrate dependency analysis capabilities."""
+    from src.analyzers.analyzer_cache import get_dependency_analyzer
+
     print("\n" + "=" * 60)
     print("DEPENDENCY ANALYSIS DEMO")
     print("=" * 60)
     
-    analyzer = DependencyAnalyzer()
+    analyzer = get_dependency_analyzer()
     
     # Python code with various dependencies
     python_code = """
@@ -188,24 +198,28 @@ public class DataController {
 }
 """
     
+    # The three snippets are independent, so detect them concurrently and
+    # print the results in order from the main thread.
+    sources = {'python': python_code, 'javascript': js_code, 'java': java_code}
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {lang: executor.submit(analyzer.detect, code, lang) for lang, code in sources.items()}
+        results = {lang: future.result() for lang, future in futures.items()}
+    python_deps = results['python']
+    js_deps = results['javascript']
+    java_deps = results['java']
+
     print("\n1. Python Dependencies:")
-    python_deps = analyzer.detect(python_code, 'python')
-    for dep in python_deps:
-        print(f"   {dep.name} ({dep.type})")
+    sys.stdout.write(_format_dependencies(python_deps))
     
     print(f"\n   Total Python dependencies: {len(python_deps)}")
     
     print("\n2. JavaScript Dependencies:")
-    js_deps = analyzer.detect(js_code, 'javascript')
-    for dep in js_deps:
-        print(f"   {dep.name} ({dep.type})")
+    sys.stdout.write(_format_dependencies(js_deps))
     
     print(f"\n   Total JavaScript dependencies: {len(js_deps)}")
     
     print("\n3. Java Dependencies:")
-    java_deps = analyzer.detect(java_code, 'java')
-    for dep in java_deps:
-        print(f"   {dep.name} ({dep.type})")
+    sys.stdout.write(_format_dependencies(java_deps))
     
     print(f"\n   Total Java dependencies: {len(java_deps)}")
     
@@ -229,12 +243,14 @@ public class DataController {
 
 def demo_integration():
     """Demonstrate integration of complexity and dependency analysis."""
+    from src.analyzers.analyzer_cache import get_complexity_analyzer, get_dependency_analyzer
+
     print("\n" + "=" * 60)
     print("INTEGRATED ANALYSIS DEMO")
     print("=" * 60)
     
-    complexity_analyzer = ComplexityAnalyzer()
-    dependency_analyzer = DependencyAnalyzer()
+    complexity_analyzer = get_complexity_analyzer()
+    dependency_analyzer = get_dependency_analyzer()
     
     # Complex code with many dependencies
     integrated_code = """
@@ -332,12 +348,9 @@ class DataProcessor:
     print(f"   Total dependencies: {len(dependencies)}")
     
     # Group dependencies by type
-    dep_by_type = {}
+    dep_by_type = defaultdict(list)
     for dep in dependencies:
-        dep_type = dep.type
-        if dep_type not in dep_by_type:
-            dep_by_type[dep_type] = []
-        dep_by_type[dep_type].append(dep.name)
+        dep_by_type[dep.type].append(dep.name)
     
     for dep_type, names in dep_by_type.items():
         print(f"   {dep_type}: {', '.join(names)}")
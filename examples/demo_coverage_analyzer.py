@@ -3,12 +3,14 @@
 Demo script for CoverageAnalyzer functionality.
 """
 
-from src.analyzers.coverage_analyzer import CoverageAnalyzer
-from src.interfaces.base_interfaces import TestSuite, TestCase, TestType, Language
+import sys
 
 
 def demo_coverage_analysis():
     """Demonstrate coverage analysis capabilities."""
+    from src.analyzers.analyzer_cache import get_coverage_analyzer
+    from src.interfaces.base_interfaces import TestSuite, TestCase, TestType, Language
+
     print("=" * 60)
     print("Coverage Analyzer Demo")
     print("=" * 60)
@@ -68,12 +70,11 @@ def factorial(n):
     )
     
     # Initialize analyzer
-    analyzer = CoverageAnalyzer()
+    analyzer = get_coverage_analyzer()
     
     print("Sample Code:")
     print("-" * 40)
-    for i, line in enumerate(sample_code.split('\n'), 1):
-        print(f"{i:2d}: {line}")
+    sys.stdout.write("".join(f"{i:2d}: {line}\n" for i, line in enumerate(sample_code.split('\n'), 1)))
     
     print("\nTest Cases:")
     print("-" * 40)
@@ -91,9 +92,10 @@ def factorial(n):
     print(f"Overall Coverage: {coverage_report.overall_percentage:.1f}%")
     
     print(f"\nLine-by-Line Coverage:")
-    for line_num, is_covered in coverage_report.line_coverage.items():
-        status = "✓" if is_covered else "✗"
-        print(f"  Line {line_num:2d}: {status}")
+    sys.stdout.write("".join(
+        f"  Line {line_num:2d}: {'✓' if is_covered else '✗'}\n"
+        for line_num, is_covered in coverage_report.line_coverage.items()
+    ))
     
     print(f"\nUntested Functions:")
     if coverage_report.untested_functions:
@@ -141,11 +143,13 @@ def factorial(n):
 
 def demo_language_support():
     """Demonstrate multi-language support."""
+    from src.analyzers.analyzer_cache import get_coverage_analyzer
+
     print("\n" + "=" * 60)
     print("Multi-Language Support Demo")
     print("=" * 60)
     
-    analyzer = CoverageAnalyzer()
+    analyzer = get_coverage_analyzer()
     
     # Test different languages
     languages = {
@@ -185,10 +189,13 @@ def demo_language_support():
         print(f"Executable lines: {len(executable_lines)}")
         print("Executable line details:")
         
+        # Collect the per-line details and emit them in a single write
+        details = []
         for line in executable_lines:
-            print(f"  Line {line.line_number}: {line.content.strip()}")
+            details.append(f"  Line {line.line_number}: {line.content.strip()}\n")
             if line.function_name:
-                print(f"    -> Function: {line.function_name}")
+                details.append(f"    -> Function: {line.function_name}\n")
+        sys.stdout.write("".join(details))
 
 
 if __name__ == "__main__":
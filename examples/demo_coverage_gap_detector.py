@@ -4,23 +4,140 @@ Demo script for coverage gap detection and reporting functionality.
 Showcases the CoverageGapDetector capabilities with sample code analysis.
 """
 
-from src.analyzers.coverage_gap_detector import (
-    CoverageGapDetector, GapType, GapSeverity
-)
-from src.analyzers.coverage_analyzer import CoverageAnalyzer
-from src.interfaces.base_interfaces import (
-    FunctionInfo, Parameter, TestSuite, TestCase, TestType, Language
-)
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import contextlib
+import io
+import sys
+from collections import defaultdict
+from functools import lru_cache
+
+# Indexed by GapSeverity, which runs from CRITICAL (0) to LOW (3)
+SEVERITY_COLORS = ("bright_red", "red", "yellow", "green")
+
+_TABLE_STYLES = {
+    "metric": dict(show_header=True, header_style="bold magenta"),
+    "gap": dict(show_header=True, header_style="bold blue"),
+}
+
+_TABLE_COLUMNS = {
+    "metric": (("Metric", "cyan"), ("Value", "green")),
+    "gap": (
+        ("Function", "cyan"),
+        ("Lines", "yellow"),
+        ("Severity", "red"),
+        ("Confidence", "green"),
+        ("Description", "white"),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def severity_tags():
+    """Return the colored label for each GapSeverity, indexed by severity."""
+    from src.analyzers.coverage_gap_detector import GapSeverity
+    
+    return tuple(
+        f"[{color}]{severity.name}[/{color}]"
+        for severity, color in zip(GapSeverity, SEVERITY_COLORS)
+    )
+
+
+@lru_cache(maxsize=None)
+def python_lexer():
+    """Return the Pygments lexer shared by every code block."""
+    from pygments.lexers import get_lexer_by_name
+    
+    return get_lexer_by_name("python", stripnl=False, ensurenl=True, tabsize=4)
+
+
+def new_table(kind):
+    """Create an empty table with the header style and columns for `kind`."""
+    from rich.table import Table
+    
+    table = Table(**_TABLE_STYLES[kind])
+    for header, style in _TABLE_COLUMNS[kind]:
+        table.add_column(header, style=style)
+    return table
+
+
+@lru_cache(maxsize=128)
+def code_block(code, line_numbers=False):
+    """Return a highlighted Python block, reused for identical snippets.
+
+    All blocks share one Pygments lexer instead of looking it up by name on
+    every render.
+    """
+    from rich.syntax import Syntax
+    
+    return Syntax(code, python_lexer(), theme="monokai", line_numbers=line_numbers)
+
+
+class _NullProgress:
+    """Stand-in for rich Progress that ignores every update."""
+    
+    def add_task(self, description, **kwargs):
+        return 0
+    
+    def update(self, task_id, **kwargs):
+        pass
+
+
+def progress_display(console):
+    """Return a spinner on a terminal, or a no-op progress when output is redirected.
+
+    A live Progress runs a refresh thread, which is wasted work when stdout is
+    a pipe or a CI log.
+    """
+    if not console.is_terminal:
+        return contextlib.nullcontext(_NullProgress())
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    )
+
+
+def render_gaps_streaming(console, gaps, chunk=500):
+    """Print gaps as a series of tables of at most `chunk` rows each.
+
+    Rich measures every row before printing a table, so one table per chunk
+    keeps layout cost and memory bounded for reports with thousands of gaps.
+    """
+    tags = severity_tags()
+    for start in range(0, len(gaps), chunk):
+        gaps_table = new_table("gap")
+        
+        for gap in gaps[start:start + chunk]:
+            gaps_table.add_row(
+                gap.function_name,
+                "%d-%d" % gap.line_range,
+                tags[gap.severity],
+                f"{gap.confidence:.1%}",
+                gap.description
+            )
+        
+        console.print(gaps_table)
 
 
 def main():
     """Demonstrate coverage gap detection and reporting."""
-    console = Console()
+    from src.analyzers.coverage_gap_detector import CoverageGapDetector
+    from src.analyzers.analyzer_cache import get_coverage_analyzer
+    from src.interfaces.base_interfaces import (
+        FunctionInfo, Parameter, TestSuite, TestCase, TestType, Language
+    )
+    from rich.console import Console
+    from rich.panel import Panel
+    
+    # Render the report into memory and write it out once at the end; the
+    # spinner still goes straight to the terminal while analysis runs
+    terminal = Console()
+    console = Console(
+        record=True, file=io.StringIO(),
+        width=terminal.width, color_system=terminal.color_system
+    )
     
     console.print(Panel.fit(
         "[bold blue]Coverage Gap Detection and Reporting Demo[/bold blue]",
@@ -79,7 +196,7 @@ def validate_input(value):
     
     # Display sample code
     console.print("\n[bold green]Sample Code to Analyze:[/bold green]")
-    syntax = Syntax(sample_code, "python", theme="monokai", line_numbers=True)
+    syntax = code_block(sample_code, line_numbers=True)
     console.print(syntax)
     
     # Sample function information
@@ -123,33 +240,22 @@ def validate_input(value):
     
     # Simulate partial test coverage (only add_numbers and partial validate_input)
     covered_functions = {"add_numbers"}
+    # Lines hit by the tests above; lines in neither set hold no statement
+    covered_lines = {
+        1, 2, 3,         # add_numbers
+        32, 33, 34,      # validate_input: def, docstring, None check
+        37, 40,          # validate_input: string branch
+    }
+    uncovered_lines = {
+        *range(5, 17),   # divide_numbers, def process_data (untested)
+        35,              # raise ValueError (uncovered error handling)
+        38, 39,          # if not value.strip() (uncovered edge case)
+        42, 43,          # numeric branch (uncovered)
+        45,              # return False (uncovered default case)
+    }
     line_coverage = {
-        1: True,   # def add_numbers
-        2: True,   # docstring
-        3: True,   # return a + b
-        5: False,  # def divide_numbers (untested)
-        6: False,  # docstring
-        7: False,  # if b == 0
-        8: False,  # raise ValueError
-        9: False,  # if a < 0
-        10: False, # return None
-        11: False, # try
-        12: False, # result = a / b
-        13: False, # except
-        14: False, # raise RuntimeError
-        15: False, # return result
-        16: False, # def process_data (untested)
-        32: True,  # def validate_input (partially tested)
-        33: True,  # docstring
-        34: True,  # if value is None
-        35: False, # raise ValueError (uncovered error handling)
-        37: True,  # if isinstance(value, str)
-        38: False, # if not value.strip() (uncovered edge case)
-        39: False, # return False
-        40: True,  # return len(value) > 3
-        42: False, # if isinstance(value, (int, float)) (uncovered branch)
-        43: False, # return value >= 0
-        45: False, # return False (uncovered default case)
+        line: line in covered_lines
+        for line in sorted(covered_lines | uncovered_lines)
     }
     
     # Create test suite with limited coverage
@@ -180,35 +286,24 @@ def validate_input(value):
     console.print(f"• Untested functions: divide_numbers, process_data")
     
     # Initialize gap detector and analyzer
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with progress_display(terminal) as progress:
         task = progress.add_task("Analyzing coverage gaps...", total=None)
         
         gap_detector = CoverageGapDetector()
-        analyzer = CoverageAnalyzer()
+        analyzer = get_coverage_analyzer()
         
-        # Generate detailed coverage report
+        # Generate detailed coverage report; it already runs gap detection
         progress.update(task, description="Generating detailed coverage report...")
         detailed_report = gap_detector.generate_detailed_report(
             sample_code, "python", covered_functions, line_coverage, functions
         )
-        
-        # Detect coverage gaps
-        progress.update(task, description="Detecting coverage gaps...")
-        gaps = gap_detector.detect_coverage_gaps(
-            sample_code, "python", covered_functions, line_coverage, functions
-        )
+        gaps = detailed_report.coverage_gaps
         
         progress.update(task, description="Analysis complete!")
     
     # Display coverage metrics
     console.print(f"\n[bold cyan]Coverage Metrics:[/bold cyan]")
-    metrics_table = Table(show_header=True, header_style="bold magenta")
-    metrics_table.add_column("Metric", style="cyan")
-    metrics_table.add_column("Value", style="green")
+    metrics_table = new_table("metric")
     
     metrics = detailed_report.metrics
     metrics_table.add_row("Overall Coverage", f"{detailed_report.overall_percentage:.1f}%")
@@ -226,40 +321,13 @@ def validate_input(value):
     # Display coverage gaps by type
     console.print(f"\n[bold red]Coverage Gaps Detected ({len(gaps)} total):[/bold red]")
     
-    gap_types = {}
+    gap_types = defaultdict(list)
     for gap in gaps:
-        gap_type = gap.gap_type.value
-        if gap_type not in gap_types:
-            gap_types[gap_type] = []
-        gap_types[gap_type].append(gap)
+        gap_types[gap.gap_type.value].append(gap)
     
     for gap_type, type_gaps in gap_types.items():
         console.print(f"\n[bold yellow]{gap_type.replace('_', ' ').title()} ({len(type_gaps)} gaps):[/bold yellow]")
-        
-        gaps_table = Table(show_header=True, header_style="bold blue")
-        gaps_table.add_column("Function", style="cyan")
-        gaps_table.add_column("Lines", style="yellow")
-        gaps_table.add_column("Severity", style="red")
-        gaps_table.add_column("Confidence", style="green")
-        gaps_table.add_column("Description", style="white")
-        
-        for gap in type_gaps:
-            severity_color = {
-                GapSeverity.CRITICAL: "bright_red",
-                GapSeverity.HIGH: "red",
-                GapSeverity.MEDIUM: "yellow",
-                GapSeverity.LOW: "green"
-            }.get(gap.severity, "white")
-            
-            gaps_table.add_row(
-                gap.function_name,
-                f"{gap.line_range[0]}-{gap.line_range[1]}",
-                f"[{severity_color}]{gap.severity.value.upper()}[/{severity_color}]",
-                f"{gap.confidence:.1%}",
-                gap.description
-            )
-        
-        console.print(gaps_table)
+        render_gaps_streaming(console, type_gaps)
     
     # Display recommendations
     console.print(f"\n[bold green]Recommendations:[/bold green]")
@@ -284,7 +352,7 @@ def validate_input(value):
         console.print(f"Type: {test.test_type.value}")
         console.print(f"Description: {test.description}")
         console.print("Generated code:")
-        test_syntax = Syntax(test.test_code, "python", theme="monokai")
+        test_syntax = code_block(test.test_code)
         console.print(test_syntax)
     
     # Show integration with CoverageAnalyzer
@@ -303,11 +371,13 @@ def validate_input(value):
         sample_test = improved_tests[0]
         console.print(f"Name: {sample_test.name}")
         console.print(f"Description: {sample_test.description}")
-        improved_syntax = Syntax(sample_test.test_code, "python", theme="monokai")
+        improved_syntax = code_block(sample_test.test_code)
         console.print(improved_syntax)
     
     console.print(f"\n[bold green]✅ Coverage gap detection and reporting demo completed![/bold green]")
     console.print(f"The system successfully identified {len(gaps)} coverage gaps and provided detailed recommendations.")
+    
+    sys.stdout.write(console.export_text(styles=terminal.is_terminal))
 
 
 if __name__ == "__main__":
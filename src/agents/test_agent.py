@@ -203,7 +203,6 @@ class TestGeneratorAgent(ITestGeneratorAgent):
         """Generate test file header."""
         if self.current_analysis.language == 'python':
             return """import pytest
-import unittest
 from unittest.mock import Mock, patch
 
 # Generated test cases
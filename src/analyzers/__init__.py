@@ -9,6 +9,13 @@ from .complexity_analyzer import ComplexityAnalyzer
 from .coverage_analyzer import CoverageAnalyzer
 from .coverage_gap_detector import CoverageGapDetector, DetailedCoverageReport, DetailedCoverageGap
 from .analysis_orchestrator import AnalysisOrchestrator
+from .analyzer_cache import (
+	get_code_parser,
+	get_function_analyzer,
+	get_complexity_analyzer,
+	get_dependency_analyzer,
+	get_coverage_analyzer,
+)
 
 __all__ = [
 	"CodeParser",
@@ -22,4 +29,9 @@ __all__ = [
 	"DetailedCoverageReport",
 	"DetailedCoverageGap",
 	"AnalysisOrchestrator",
+	"get_code_parser",
+	"get_function_analyzer",
+	"get_complexity_analyzer",
+	"get_dependency_analyzer",
+	"get_coverage_analyzer",
 ]
\ No newline at end of file
@@ -12,6 +12,7 @@ from .class_analyzer import ClassAnalyzer
 from .edge_case_detector import EdgeCaseDetector
 from .dependency_analyzer import DependencyAnalyzer
 from .complexity_analyzer import ComplexityAnalyzer
+from .analyzer_cache import get_code_parser
 
 
 class AnalysisOrchestrator:
@@ -24,7 +25,7 @@ class AnalysisOrchestrator:
                  edge_detector: Optional[EdgeCaseDetector] = None,
                  dep_analyzer: Optional[DependencyAnalyzer] = None,
                  complexity_analyzer: Optional[ComplexityAnalyzer] = None):
-        self.parser = parser or CodeParser()
+        self.parser = parser or get_code_parser()
         self.func_analyzer = func_analyzer or FunctionAnalyzer(self.parser)
         self.class_analyzer = class_analyzer or ClassAnalyzer(self.parser)
         self.edge_detector = edge_detector or EdgeCaseDetector()
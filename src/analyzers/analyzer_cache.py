@@ -0,0 +1,44 @@
+"""
+Shared, lazily-created analyzer instances.
+
+A CodeParser loads each tree-sitter grammar on first use of its language and
+caches parsed trees, so scripts and tools that analyze code repeatedly should
+reuse one instance via these getters.
+"""
+from functools import lru_cache
+
+from .code_parser import CodeParser
+from .function_analyzer import FunctionAnalyzer
+from .complexity_analyzer import ComplexityAnalyzer
+from .dependency_analyzer import DependencyAnalyzer
+from .coverage_analyzer import CoverageAnalyzer
+
+
+@lru_cache(maxsize=None)
+def get_code_parser() -> CodeParser:
+    """Return the shared CodeParser instance."""
+    return CodeParser()
+
+
+@lru_cache(maxsize=None)
+def get_function_analyzer() -> FunctionAnalyzer:
+    """Return the shared FunctionAnalyzer, backed by the shared CodeParser."""
+    return FunctionAnalyzer(get_code_parser())
+
+
+@lru_cache(maxsize=None)
+def get_complexity_analyzer() -> ComplexityAnalyzer:
+    """Return the shared ComplexityAnalyzer instance."""
+    return ComplexityAnalyzer()
+
+
+@lru_cache(maxsize=None)
+def get_dependency_analyzer() -> DependencyAnalyzer:
+    """Return the shared DependencyAnalyzer instance."""
+    return DependencyAnalyzer()
+
+
+@lru_cache(maxsize=None)
+def get_coverage_analyzer() -> CoverageAnalyzer:
+    """Return the shared CoverageAnalyzer instance."""
+    return CoverageAnalyzer()
@@ -2,11 +2,16 @@
 Tree-sitter based code parser for multi-language support.
 """
 import tree_sitter
-from tree_sitter import Language, Parser
-from typing import Dict, List, Any, Optional, Tuple
+from tree_sitter import Language, Parser, Query, QueryCursor
+from typing import Dict, List, Any, Iterator, Mapping, Optional, Tuple, Union
 from pathlib import Path
+from collections import OrderedDict
+import hashlib
+import importlib
 import logging
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
+from functools import cached_property
 
 from ..interfaces.base_interfaces import (
     ICodeAnalyzer, CodeAnalysis, FunctionInfo, ClassInfo, Parameter,
@@ -20,12 +25,20 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class ASTNode:
-    """Wrapper for tree-sitter nodes with additional metadata."""
+    """Wrapper for tree-sitter nodes with additional metadata.
+
+    ASTNode is a read-only view that caches derived values such as ``text``;
+    to reflect an edited tree, wrap the new node in a fresh ASTNode.
+    """
     node: tree_sitter.Node
     source_code: str
     language: str = None
+    # Tree the node belongs to; set on the roots returned by CodeParser.parse_code
+    tree: Optional[tree_sitter.Tree] = field(default=None, repr=False, compare=False)
+    # Indexed descendants by node type, filled on first use by CodeParser._index_nodes
+    _nodes_by_type: Optional[Dict[str, List['ASTNode']]] = field(default=None, init=False, repr=False, compare=False)
     
-    @property
+    @cached_property
     def text(self) -> str:
         """Get the text content of the node."""
         return self.source_code[self.node.start_byte:self.node.end_byte]
@@ -46,40 +59,197 @@ class ASTNode:
         return self.node.end_point
 
 
+# Language for each supported source file extension
+_EXT_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+}
+
+# Module providing the tree-sitter grammar for each supported language
+_LANGUAGE_MODULES = {
+    'python': 'tree_sitter_python',
+    'javascript': 'tree_sitter_javascript',
+    'typescript': 'tree_sitter_javascript',  # Use JS parser for TS
+    'java': 'tree_sitter_java',
+}
+
+# Control-flow node types that each add a decision point to cyclomatic complexity
+_DECISION_NODE_TYPES = ('if_statement', 'while_statement', 'for_statement',
+                        'try_statement', 'catch_clause', 'switch_statement')
+
+# Node types each language's extractors look up, gathered by one query per tree
+_INDEXED_NODE_TYPES: Dict[str, frozenset] = {
+    'python': frozenset(_DECISION_NODE_TYPES + (
+        'function_definition', 'class_definition', 'binary_operator', 'subscript',
+        'import_statement', 'import_from_statement',
+    )),
+    'javascript': frozenset(_DECISION_NODE_TYPES + (
+        'function_declaration', 'function_expression', 'arrow_function', 'method_definition',
+        'class_declaration', 'binary_expression', 'unary_expression', 'throw_statement',
+        'import_statement',
+    )),
+    'java': frozenset(_DECISION_NODE_TYPES + (
+        'method_declaration', 'class_declaration', 'field_access', 'method_invocation',
+        'array_access', 'binary_expression', 'import_declaration',
+    )),
+}
+_INDEXED_NODE_TYPES['typescript'] = _INDEXED_NODE_TYPES['javascript']
+# Indexed for nodes whose language is unknown, which have no compiled query
+_ALL_INDEXED_NODE_TYPES = frozenset().union(*_INDEXED_NODE_TYPES.values())
+
+# Number of parsed trees each CodeParser keeps, keyed by language and source hash
+_TREE_CACHE_SIZE = 256
+
+# Process-wide tree-sitter languages and compiled node-index queries, each
+# loaded on first use of its language; parsers are kept per thread because a tree-sitter Parser must not be used by two
+# threads at once
+_pool_lock = threading.Lock()
+_LANGUAGES: Dict[str, Language] = {}
+_QUERIES: Dict[str, Query] = {}
+_thread_parsers = threading.local()
+
+
+def _load_language(name: str) -> Language:
+    """Return the grammar for ``name``, importing it and compiling its query on first use."""
+    language = _LANGUAGES.get(name)
+    if language is None:
+        with _pool_lock:
+            if name not in _LANGUAGES:
+                try:
+                    module = importlib.import_module(_LANGUAGE_MODULES[name])
+                except ImportError as e:
+                    logger.error(f"Failed to import tree-sitter language bindings: {e}")
+                    raise RuntimeError(f"Tree-sitter language bindings not available: {e}")
+                
+                loaded = Language(module.language())
+                _QUERIES[name] = _compile_index_query(loaded, _INDEXED_NODE_TYPES[name])
+                _LANGUAGES[name] = loaded
+                logger.info(f"Loaded tree-sitter grammar for {name}")
+            language = _LANGUAGES[name]
+    
+    return language
+
+
+def _compile_index_query(language: Language, node_types: frozenset) -> Query:
+    """Compile one query capturing every node type in ``node_types`` under its own name.
+
+    Types the grammar does not define (e.g. ``switch_statement`` in Python)
+    are left out, since tree-sitter rejects unknown node kinds.
+    """
+    patterns = [
+        f"({node_type}) @{node_type}"
+        for node_type in sorted(node_types)
+        if language.id_for_node_kind(node_type, True) is not None
+    ]
+    return Query(language, " ".join(patterns))
+
+
+def _local_parsers() -> Dict[str, Parser]:
+    """Return the calling thread's parsers created so far, keyed by language."""
+    parsers = getattr(_thread_parsers, 'parsers', None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+    return parsers
+
+
+def _thread_parser(language: str) -> Parser:
+    """Return the calling thread's parser for ``language``, creating it on first use."""
+    parsers = _local_parsers()
+    parser = parsers.get(language)
+    if parser is None:
+        parser = parsers[language] = Parser(_load_language(language))
+    return parser
+
+
+def get_parser(language: str) -> Parser:
+    """Return the calling thread's tree-sitter parser for ``language``, reset for a new parse."""
+    if language not in _LANGUAGE_MODULES:
+        raise ValueError(f"No parser available for language: {language}")
+    parser = _thread_parser(language)
+    parser.reset()
+    return parser
+
+
+class _SupportedLanguages(Mapping):
+    """Supported tree-sitter languages keyed by name.
+
+    Membership checks only look at the names; a grammar is loaded the
+    first time its value is read.
+    """
+    
+    def __getitem__(self, name: str) -> Language:
+        if name not in _LANGUAGE_MODULES:
+            raise KeyError(name)
+        return _load_language(name)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in _LANGUAGE_MODULES
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_LANGUAGE_MODULES)
+    
+    def __len__(self) -> int:
+        return len(_LANGUAGE_MODULES)
+
+
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    """Length of the common prefix of two byte strings (binary search on slices)."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_length(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common suffix of two byte strings, capped at ``limit``."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point_at(source_bytes: bytes, offset: int) -> Tuple[int, int]:
+    """Convert a byte offset into a tree-sitter (row, column) point."""
+    row = source_bytes.count(b'\n', 0, offset)
+    column = offset - (source_bytes.rfind(b'\n', 0, offset) + 1)
+    return row, column
+
+
 class CodeParser(ICodeAnalyzer):
     """Tree-sitter based code parser supporting Python, Java, and JavaScript."""
     
     def __init__(self):
-        """Initialize the parser with language support."""
-        self.parsers: Dict[str, Parser] = {}
-        self.languages: Dict[str, Language] = {}
+        """Initialize the parser with language support.
+
+        Grammars are loaded on first use of each language, not here.
+        """
+        self.languages: Mapping[str, Language] = _SupportedLanguages()
         self.edge_case_detector = EdgeCaseDetector()
-        self._setup_languages()
+        # Most recent (source bytes, tree) per language, reused for incremental reparses
+        self._last_parse: Dict[str, Tuple[bytes, tree_sitter.Tree]] = {}
+        # LRU of parsed trees keyed by (language, source digest); trees are only read, never edited
+        self._tree_cache: "OrderedDict[Tuple[str, bytes], Tuple[bytes, tree_sitter.Tree]]" = OrderedDict()
     
-    def _setup_languages(self):
-        """Set up tree-sitter languages and parsers."""
-        try:
-            # Import tree-sitter language bindings
-            import tree_sitter_python as tspython
-            import tree_sitter_javascript as tsjavascript
-            import tree_sitter_java as tsjava
-            
-            # Create language objects
-            self.languages['python'] = Language(tspython.language())
-            self.languages['javascript'] = Language(tsjavascript.language())
-            self.languages['typescript'] = Language(tsjavascript.language())  # Use JS parser for TS
-            self.languages['java'] = Language(tsjava.language())
-            
-            # Create parsers for each language
-            for lang_name, language in self.languages.items():
-                parser = Parser(language)
-                self.parsers[lang_name] = parser
-                
-            logger.info(f"Initialized parsers for languages: {list(self.languages.keys())}")
-            
-        except ImportError as e:
-            logger.error(f"Failed to import tree-sitter language bindings: {e}")
-            raise RuntimeError(f"Tree-sitter language bindings not available: {e}")
+    @property
+    def parsers(self) -> Dict[str, Parser]:
+        """The calling thread's tree-sitter parsers created so far, keyed by language.
+
+        A language's parser is created the first time that language is
+        parsed; use ``languages`` for the full set of supported languages.
+        """
+        return _local_parsers()
     
     def analyze_file(self, file_path: str, language: Optional[str] = None) -> CodeAnalysis:
         """Analyze a code file and return structured analysis."""
@@ -88,32 +258,54 @@ class CodeParser(ICodeAnalyzer):
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        # Detect language if not provided
+        # Detect language before reading so unsupported files are rejected early
         if not language:
             language = self._detect_language(path)
         
         if language not in self.languages:
             raise ValueError(f"Unsupported language: {language}")
         
-        # Read file content
+        return self.analyze_file_text(self._read_source(path), path, language)
+    
+    def analyze_file_text(self, code: str, file_path: str, language: Optional[str] = None) -> CodeAnalysis:
+        """Analyze source already read from ``file_path``, detecting the language from its name."""
+        if not language:
+            language = self._detect_language(Path(file_path))
+        
+        return self.analyze_code(code, language)
+    
+    def _read_source(self, path: Path) -> str:
+        """Read a source file as UTF-8, falling back to latin-1."""
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                code = f.read()
+                return f.read()
         except UnicodeDecodeError:
             # Try with different encoding
             with open(path, 'r', encoding='latin-1') as f:
-                code = f.read()
-        
-        return self.analyze_code(code, language)
+                return f.read()
     
     def analyze_code(self, code: str, language: str) -> CodeAnalysis:
-        """Analyze code string and return structured analysis."""
+        """Analyze code string and return structured analysis.
+
+        Callers that already hold the parsed tree should pass it to
+        ``analyze_all`` instead of parsing the source again.
+        """
         if language not in self.languages:
             raise ValueError(f"Unsupported language: {language}")
         
         # Parse code into AST
         ast = self.parse_code(code, language)
         
+        return self.analyze_all(ast)
+    
+    def analyze_all(self, ast: ASTNode) -> CodeAnalysis:
+        """Build the full analysis of a parsed tree.
+
+        Every extractor reads the same node index, so the whole tree is
+        walked once, plus one walk per function for its complexity.
+        """
+        language = ast.language
+        
         # Extract information from AST
         functions = self.identify_functions(ast)
         classes = self.identify_classes(ast)
@@ -130,18 +322,119 @@ class CodeParser(ICodeAnalyzer):
             complexity_metrics=complexity_metrics
         )
     
-    def parse_code(self, code: str, language: str) -> ASTNode:
-        """Parse code into an abstract syntax tree."""
-        if language not in self.parsers:
+    def parse_code(self, code: Union[str, bytes], language: str) -> ASTNode:
+        """Parse code into an abstract syntax tree.
+
+        The whole source is encoded once and handed to tree-sitter as a
+        single buffer rather than through a streaming read callback; UTF-8
+        bytes are used as given. Trees are cached by source content, so
+        parsing the same code again returns the cached tree without calling
+        tree-sitter.
+        """
+        if language not in self.languages:
             raise ValueError(f"No parser available for language: {language}")
-        
-        parser = self.parsers[language]
-        tree = parser.parse(bytes(code, 'utf-8'))
-        
+
+        code, source_bytes = self._encode_source(code)
+        key = (language, hashlib.blake2b(source_bytes, digest_size=16).digest())
+        cached = self._tree_cache.get(key)
+        if cached is not None and cached[0] == source_bytes:
+            self._tree_cache.move_to_end(key)
+            tree = cached[1]
+            self._last_parse[language] = (source_bytes, tree)
+        else:
+            parser = get_parser(language)
+            old_tree = self._edited_previous_tree(language, source_bytes)
+            if old_tree is not None:
+                tree = parser.parse(source_bytes, old_tree)
+            else:
+                tree = parser.parse(source_bytes)
+            self._remember_tree(key, source_bytes, tree)
+        
+        return self._wrap_tree(tree, code, language)
+    
+    def reparse(self, code: Union[str, bytes], previous: ASTNode, **edit: Any) -> ASTNode:
+        """Parse ``code`` as an edit of ``previous``, a root returned by ``parse_code``.
+
+        For callers that already know what changed, such as editors and file
+        watchers. ``edit`` holds the ``tree_sitter.Tree.edit`` arguments
+        (``start_byte``, ``old_end_byte``, ``new_end_byte``, ``start_point``,
+        ``old_end_point``, ``new_end_point``). The edit is applied to a copy of
+        ``previous.tree``, and subtrees outside it are reused without diffing
+        the sources.
+        """
+        if previous.tree is None:
+            raise ValueError("reparse needs a root node returned by parse_code")
+        
+        language = previous.language
+        code, source_bytes = self._encode_source(code)
+        old_tree = previous.tree.copy()
+        old_tree.edit(**edit)
+        tree = get_parser(language).parse(source_bytes, old_tree)
+        self._remember_tree((language, hashlib.blake2b(source_bytes, digest_size=16).digest()), source_bytes, tree)
+        
+        return self._wrap_tree(tree, code, language)
+    
+    def _encode_source(self, code: Union[str, bytes]) -> Tuple[str, bytes]:
+        """Return ``code`` as both text and UTF-8 bytes."""
+        if isinstance(code, (bytes, bytearray)):
+            source_bytes = bytes(code)
+            return source_bytes.decode('utf-8'), source_bytes
+        return code, code.encode('utf-8')
+    
+    def _remember_tree(self, key: Tuple[str, bytes], source_bytes: bytes, tree: tree_sitter.Tree) -> None:
+        """Cache a freshly parsed tree and make it the base for the next incremental parse."""
+        self._tree_cache[key] = (source_bytes, tree)
+        self._tree_cache.move_to_end(key)
+        if len(self._tree_cache) > _TREE_CACHE_SIZE:
+            self._tree_cache.popitem(last=False)
+        self._last_parse[key[0]] = (source_bytes, tree)
+    
+    def _wrap_tree(self, tree: tree_sitter.Tree, code: str, language: str) -> ASTNode:
+        """Wrap a parsed tree's root, logging any parse errors."""
         if tree.root_node.has_error:
             logger.warning(f"Parse errors detected in {language} code")
         
-        return ASTNode(tree.root_node, code, language)
+        return ASTNode(tree.root_node, code, language, tree)
+    
+    def clear_cache(self) -> None:
+        """Drop cached trees so the next parse of any source starts from scratch."""
+        self._tree_cache.clear()
+        self._last_parse.clear()
+    
+    def _edited_previous_tree(self, language: str, source_bytes: bytes) -> Optional[tree_sitter.Tree]:
+        """Return the previous tree for ``language`` edited to match ``source_bytes``.
+
+        The changed region is taken as the span between the common prefix and
+        suffix of the old and new sources. Returns None when there is no
+        previous tree or when most of the source is new, in which case a
+        fresh parse is just as cheap.
+        """
+        previous = self._last_parse.get(language)
+        if previous is None:
+            return None
+        
+        old_bytes, old_tree = previous
+        if old_bytes == source_bytes:
+            return old_tree
+        
+        prefix = _common_prefix_length(old_bytes, source_bytes)
+        suffix = _common_suffix_length(old_bytes, source_bytes, min(len(old_bytes), len(source_bytes)) - prefix)
+        if (prefix + suffix) * 2 < len(source_bytes):
+            return None
+        
+        old_end = len(old_bytes) - suffix
+        new_end = len(source_bytes) - suffix
+        # Edit a copy so trees already handed out to callers keep their offsets
+        tree = old_tree.copy()
+        tree.edit(
+            start_byte=prefix,
+            old_end_byte=old_end,
+            new_end_byte=new_end,
+            start_point=_point_at(old_bytes, prefix),
+            old_end_point=_point_at(old_bytes, old_end),
+            new_end_point=_point_at(source_bytes, new_end),
+        )
+        return tree
     
     def _get_language_name(self, ast: ASTNode) -> Optional[str]:
         """Determine language name from AST node."""
@@ -224,40 +517,91 @@ class CodeParser(ICodeAnalyzer):
     
     def _detect_language(self, path: Path) -> str:
         """Detect programming language from file extension."""
-        extension_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'javascript',
-            '.tsx': 'typescript',
-            '.java': 'java'
-        }
-        
-        suffix = path.suffix.lower()
-        language = extension_map.get(suffix)
+        return self._detect_language_from_suffix(path.suffix)
+    
+    def _detect_language_from_suffix(self, suffix: str) -> str:
+        """Detect programming language from a file extension such as ``'.py'``."""
+        language = _EXT_MAP.get(suffix.lower())
         
         if not language:
-            raise ValueError(f"Cannot detect language for file extension: {suffix}")
+            raise ValueError(f"Cannot detect language for file extension: {suffix.lower()}")
         
         return language
     
     def _traverse_ast(self, node: tree_sitter.Node, source_code: str, node_type: str = None, language: str = None) -> List[ASTNode]:
-        """Traverse AST and find nodes of specific type."""
+        """Traverse AST and find nodes of specific type.
+
+        Walks the tree depth-first with a tree-sitter cursor so that only
+        matching nodes are wrapped in ``ASTNode``. The walk is a loop rather
+        than recursion, so nesting depth is not bounded by Python's stack.
+        """
         nodes = []
-        
-        if node_type is None or node.type == node_type:
-            nodes.append(ASTNode(node, source_code, language))
-        
-        for child in node.children:
-            nodes.extend(self._traverse_ast(child, source_code, node_type, language))
-        
-        return nodes
+        cursor = node.walk()
+
+        while True:
+            current = cursor.node
+            if node_type is None or current.type == node_type:
+                nodes.append(ASTNode(current, source_code, language))
+
+            if cursor.goto_first_child():
+                continue
+
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return nodes
+    
+    def _index_nodes(self, ast: ASTNode) -> Dict[str, List[ASTNode]]:
+        """Group the indexed node types under ``ast`` with the language's compiled query.
+
+        The query runs in tree-sitter's C runtime. Captures do not come back
+        in document order, so each type's nodes are sorted into pre-order
+        (outer nodes before the nodes they contain). Nodes without a
+        supported language are indexed by a cursor walk over every
+        language's indexed types. The index is stored on ``ast``, so later
+        lookups on the same node reuse it.
+        """
+        if ast._nodes_by_type is None:
+            if ast.language in _LANGUAGE_MODULES:
+                _load_language(ast.language)
+                captures = QueryCursor(_QUERIES[ast.language]).captures(ast.node)
+                ast._nodes_by_type = {
+                    node_type: [
+                        ASTNode(node, ast.source_code, ast.language)
+                        for node in sorted(nodes, key=lambda n: (n.start_byte, -n.end_byte))
+                    ]
+                    for node_type, nodes in captures.items()
+                }
+            else:
+                ast._nodes_by_type = self._walk_index(ast, _ALL_INDEXED_NODE_TYPES)
+        
+        return ast._nodes_by_type
+    
+    def _walk_index(self, ast: ASTNode, wanted: frozenset) -> Dict[str, List[ASTNode]]:
+        """Group the nodes under ``ast`` whose type is in ``wanted`` in one pre-order cursor walk."""
+        index: Dict[str, List[ASTNode]] = {}
+        cursor = ast.node.walk()
+        
+        while True:
+            current = cursor.node
+            if current.type in wanted:
+                index.setdefault(current.type, []).append(ASTNode(current, ast.source_code, ast.language))
+            
+            if cursor.goto_first_child():
+                continue
+            
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return index
+    
+    def _nodes_of_type(self, ast: ASTNode, node_type: str) -> List[ASTNode]:
+        """Return the nodes of ``node_type`` under ``ast`` (including itself), in source order."""
+        return self._index_nodes(ast).get(node_type, [])
     
     # Python-specific methods
     def _extract_python_functions(self, ast: ASTNode) -> List[FunctionInfo]:
         """Extract Python function information."""
         functions = []
-        function_nodes = self._traverse_ast(ast.node, ast.source_code, 'function_definition', ast.language)
+        function_nodes = self._nodes_of_type(ast, 'function_definition')
         
         for func_node in function_nodes:
             name = self._get_python_function_name(func_node)
@@ -281,7 +625,7 @@ class CodeParser(ICodeAnalyzer):
     def _extract_python_classes(self, ast: ASTNode) -> List[ClassInfo]:
         """Extract Python class information."""
         classes = []
-        class_nodes = self._traverse_ast(ast.node, ast.source_code, 'class_definition', ast.language)
+        class_nodes = self._nodes_of_type(ast, 'class_definition')
         
         for class_node in class_nodes:
             name = self._get_python_class_name(class_node)
@@ -303,7 +647,7 @@ class CodeParser(ICodeAnalyzer):
         edge_cases = []
         
         # Find division operations (potential division by zero)
-        div_nodes = self._traverse_ast(ast.node, ast.source_code, 'binary_operator', ast.language)
+        div_nodes = self._nodes_of_type(ast, 'binary_operator')
         for node in div_nodes:
             if '/' in node.text:
                 edge_cases.append(EdgeCase(
@@ -314,7 +658,7 @@ class CodeParser(ICodeAnalyzer):
                 ))
         
         # Find list/dict access (potential index/key errors)
-        subscript_nodes = self._traverse_ast(ast.node, ast.source_code, 'subscript', ast.language)
+        subscript_nodes = self._nodes_of_type(ast, 'subscript')
         for node in subscript_nodes:
             edge_cases.append(EdgeCase(
                 type='index_access',
@@ -330,8 +674,8 @@ class CodeParser(ICodeAnalyzer):
         dependencies = []
         
         # Find import statements
-        import_nodes = self._traverse_ast(ast.node, ast.source_code, 'import_statement', ast.language)
-        import_from_nodes = self._traverse_ast(ast.node, ast.source_code, 'import_from_statement', ast.language)
+        import_nodes = self._nodes_of_type(ast, 'import_statement')
+        import_from_nodes = self._nodes_of_type(ast, 'import_from_statement')
         
         for node in import_nodes + import_from_nodes:
             dep_name = self._extract_import_name(node)
@@ -352,7 +696,7 @@ class CodeParser(ICodeAnalyzer):
         # Find function declarations and expressions
         func_types = ['function_declaration', 'function_expression', 'arrow_function']
         for func_type in func_types:
-            func_nodes = self._traverse_ast(ast.node, ast.source_code, func_type, ast.language)
+            func_nodes = self._nodes_of_type(ast, func_type)
             for func_node in func_nodes:
                 name = self._get_javascript_function_name(func_node, func_type)
                 parameters = self._get_javascript_function_parameters(func_node)
@@ -368,7 +712,7 @@ class CodeParser(ICodeAnalyzer):
                 ))
         
         # Also find class methods
-        method_nodes = self._traverse_ast(ast.node, ast.source_code, 'method_definition', ast.language)
+        method_nodes = self._nodes_of_type(ast, 'method_definition')
         for method_node in method_nodes:
             name = self._get_javascript_method_name(method_node)
             parameters = self._get_javascript_function_parameters(method_node)
@@ -388,7 +732,7 @@ class CodeParser(ICodeAnalyzer):
     def _extract_javascript_classes(self, ast: ASTNode) -> List[ClassInfo]:
         """Extract JavaScript class information."""
         classes = []
-        class_nodes = self._traverse_ast(ast.node, ast.source_code, 'class_declaration', ast.language)
+        class_nodes = self._nodes_of_type(ast, 'class_declaration')
         
         for class_node in class_nodes:
             name = self._get_javascript_class_name(class_node)
@@ -409,7 +753,7 @@ class CodeParser(ICodeAnalyzer):
         edge_cases = []
         
         # Find null/undefined checks
-        binary_nodes = self._traverse_ast(ast.node, ast.source_code, 'binary_expression', ast.language)
+        binary_nodes = self._nodes_of_type(ast, 'binary_expression')
         for node in binary_nodes:
             if 'null' in node.text or 'undefined' in node.text:
                 edge_cases.append(EdgeCase(
@@ -420,7 +764,7 @@ class CodeParser(ICodeAnalyzer):
                 ))
         
         # Find logical expressions that might indicate edge case handling
-        unary_nodes = self._traverse_ast(ast.node, ast.source_code, 'unary_expression', ast.language)
+        unary_nodes = self._nodes_of_type(ast, 'unary_expression')
         for node in unary_nodes:
             if '!' in node.text:
                 edge_cases.append(EdgeCase(
@@ -431,7 +775,7 @@ class CodeParser(ICodeAnalyzer):
                 ))
         
         # Find try-catch blocks
-        try_nodes = self._traverse_ast(ast.node, ast.source_code, 'try_statement', ast.language)
+        try_nodes = self._nodes_of_type(ast, 'try_statement')
         for node in try_nodes:
             edge_cases.append(EdgeCase(
                 type='exception_handling',
@@ -441,7 +785,7 @@ class CodeParser(ICodeAnalyzer):
             ))
         
         # Find throw statements
-        throw_nodes = self._traverse_ast(ast.node, ast.source_code, 'throw_statement', ast.language)
+        throw_nodes = self._nodes_of_type(ast, 'throw_statement')
         for node in throw_nodes:
             edge_cases.append(EdgeCase(
                 type='error_throwing',
@@ -457,7 +801,7 @@ class CodeParser(ICodeAnalyzer):
         dependencies = []
         
         # Find import statements
-        import_nodes = self._traverse_ast(ast.node, ast.source_code, 'import_statement', ast.language)
+        import_nodes = self._nodes_of_type(ast, 'import_statement')
         for node in import_nodes:
             dep_name = self._extract_js_import_name(node)
             if dep_name:
@@ -473,7 +817,7 @@ class CodeParser(ICodeAnalyzer):
     def _extract_java_functions(self, ast: ASTNode) -> List[FunctionInfo]:
         """Extract Java method information."""
         functions = []
-        method_nodes = self._traverse_ast(ast.node, ast.source_code, 'method_declaration', ast.language)
+        method_nodes = self._nodes_of_type(ast, 'method_declaration')
         
         for method_node in method_nodes:
             name = self._get_java_method_name(method_node)
@@ -495,7 +839,7 @@ class CodeParser(ICodeAnalyzer):
     def _extract_java_classes(self, ast: ASTNode) -> List[ClassInfo]:
         """Extract Java class information."""
         classes = []
-        class_nodes = self._traverse_ast(ast.node, ast.source_code, 'class_declaration', ast.language)
+        class_nodes = self._nodes_of_type(ast, 'class_declaration')
         
         for class_node in class_nodes:
             name = self._get_java_class_name(class_node)
@@ -517,7 +861,7 @@ class CodeParser(ICodeAnalyzer):
         edge_cases = []
         
         # Find null pointer potential from field access
-        member_access_nodes = self._traverse_ast(ast.node, ast.source_code, 'field_access', ast.language)
+        member_access_nodes = self._nodes_of_type(ast, 'field_access')
         for node in member_access_nodes:
             edge_cases.append(EdgeCase(
                 type='null_pointer',
@@ -527,7 +871,7 @@ class CodeParser(ICodeAnalyzer):
             ))
         
         # Find method invocations (potential null pointer)
-        method_invocation_nodes = self._traverse_ast(ast.node, ast.source_code, 'method_invocation', ast.language)
+        method_invocation_nodes = self._nodes_of_type(ast, 'method_invocation')
         for node in method_invocation_nodes:
             edge_cases.append(EdgeCase(
                 type='null_pointer',
@@ -537,7 +881,7 @@ class CodeParser(ICodeAnalyzer):
             ))
         
         # Find array access (potential index out of bounds)
-        array_access_nodes = self._traverse_ast(ast.node, ast.source_code, 'array_access', ast.language)
+        array_access_nodes = self._nodes_of_type(ast, 'array_access')
         for node in array_access_nodes:
             edge_cases.append(EdgeCase(
                 type='array_bounds',
@@ -547,7 +891,7 @@ class CodeParser(ICodeAnalyzer):
             ))
         
         # Find null comparisons (good practice, but indicates null handling)
-        binary_expr_nodes = self._traverse_ast(ast.node, ast.source_code, 'binary_expression', ast.language)
+        binary_expr_nodes = self._nodes_of_type(ast, 'binary_expression')
         for node in binary_expr_nodes:
             if 'null' in node.text:
                 edge_cases.append(EdgeCase(
@@ -563,7 +907,7 @@ class CodeParser(ICodeAnalyzer):
         """Find Java import dependencies."""
         dependencies = []
         
-        import_nodes = self._traverse_ast(ast.node, ast.source_code, 'import_declaration', ast.language)
+        import_nodes = self._nodes_of_type(ast, 'import_declaration')
         for node in import_nodes:
             dep_name = self._extract_java_import_name(node)
             if dep_name:
@@ -786,12 +1130,8 @@ class CodeParser(ICodeAnalyzer):
         complexity = 1  # Base complexity
         
         # Count decision points
-        decision_nodes = ['if_statement', 'while_statement', 'for_statement', 
-                         'try_statement', 'catch_clause', 'switch_statement']
-        
-        for node_type in decision_nodes:
-            nodes = self._traverse_ast(ast.node, ast.source_code, node_type, ast.language)
-            complexity += len(nodes)
+        for node_type in _DECISION_NODE_TYPES:
+            complexity += len(self._nodes_of_type(ast, node_type))
         
         return complexity
     
@@ -802,7 +1142,7 @@ class CodeParser(ICodeAnalyzer):
     
     def _count_lines_of_code(self, ast: ASTNode) -> int:
         """Count lines of code."""
-        return len(ast.source_code.split('\n'))
+        return ast.source_code.count('\n') + 1
     
     def _calculate_maintainability_index(self, cyclomatic: int, loc: int) -> float:
         """Calculate maintainability index (simplified formula)."""
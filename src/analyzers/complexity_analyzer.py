@@ -3,7 +3,9 @@ Complexity analyzer: compute comprehensive code metrics using AST analysis.
 """
 from __future__ import annotations
 
+import math
 import tree_sitter
+from functools import lru_cache
 from typing import List, Dict, Set, Optional, Tuple
 import logging
 
@@ -62,6 +64,15 @@ class ComplexityAnalyzer:
         'java': {'method_invocation'}
     }
 
+    # Per-kind flags used by the control flow pass
+    _KIND_CONTROL_FLOW = 1
+    _KIND_LOGICAL_OPERATOR = 2
+
+    def __init__(self):
+        # language -> {node kind_id: flags}, filled lazily as kinds are seen so
+        # the hot loop compares small ints instead of building type strings
+        self._kind_flags: Dict[str, Dict[int, int]] = {}
+
     def analyze(self, code: str, language: str = 'python', ast_node: Optional[tree_sitter.Node] = None) -> ComplexityMetrics:
         """Analyze code complexity using both text-based and AST-based methods."""
         if ast_node is not None:
@@ -71,6 +82,19 @@ class ComplexityAnalyzer:
 
     def _analyze_text_based(self, code: str) -> ComplexityMetrics:
         """Fallback text-based analysis for backward compatibility."""
+        cyclo, cognitive, loc, mi = self._text_metrics(code)
+
+        return ComplexityMetrics(
+            cyclomatic_complexity=cyclo,
+            cognitive_complexity=cognitive,
+            lines_of_code=loc,
+            maintainability_index=mi,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _text_metrics(code: str) -> Tuple[int, int, int, float]:
+        """Compute text-based metrics, memoized on the source so repeated snippets are free."""
         CONTROL_TOKENS = (
             'if ', 'elif ', 'else:', 'for ', 'while ', 'case ', 'switch ', 'try:', 'except', 'catch', '&&', '||'
         )
@@ -82,17 +106,11 @@ class ComplexityAnalyzer:
         cognitive = max(0, cyclo - 1)
         mi = max(0.0, 100.0 - (cyclo * 2 + cognitive * 1.5) - (loc * 0.1))
         
-        return ComplexityMetrics(
-            cyclomatic_complexity=cyclo,
-            cognitive_complexity=cognitive,
-            lines_of_code=loc,
-            maintainability_index=round(mi, 2),
-        )
+        return cyclo, cognitive, loc, round(mi, 2)
 
     def _analyze_with_ast(self, ast_node: tree_sitter.Node, code: str, language: str) -> ComplexityMetrics:
         """Comprehensive AST-based complexity analysis."""
-        cyclomatic = self._calculate_cyclomatic_complexity(ast_node, language)
-        cognitive = self._calculate_cognitive_complexity(ast_node, language)
+        cyclomatic, cognitive = self._calculate_control_flow_complexity(ast_node, language)
         loc = self._count_effective_lines_of_code(ast_node, code, language)
         maintainability = self._calculate_maintainability_index(cyclomatic, cognitive, loc)
         
@@ -105,53 +123,58 @@ class ComplexityAnalyzer:
 
     def _calculate_cyclomatic_complexity(self, node: tree_sitter.Node, language: str) -> int:
         """Calculate McCabe cyclomatic complexity from AST."""
-        complexity = 1  # Base complexity
-        control_flow_nodes = self.CONTROL_FLOW_NODES.get(language, set())
-        
-        def traverse(n: tree_sitter.Node):
-            nonlocal complexity
-            if n.type in control_flow_nodes:
-                complexity += 1
-            
-            # Special handling for logical operators
-            if n.type in ('boolean_operator', 'binary_expression'):
-                # Count && and || operators
-                node_text = n.text.decode('utf-8') if hasattr(n, 'text') else ''
-                complexity += node_text.count('&&') + node_text.count('||')
-            
-            for child in n.children:
-                traverse(child)
-        
-        traverse(node)
-        return complexity
+        return self._calculate_control_flow_complexity(node, language)[0]
 
     def _calculate_cognitive_complexity(self, node: tree_sitter.Node, language: str) -> int:
         """Calculate cognitive complexity considering nesting and control flow."""
+        return self._calculate_control_flow_complexity(node, language)[1]
+
+    def _calculate_control_flow_complexity(self, node: tree_sitter.Node, language: str) -> Tuple[int, int]:
+        """Compute (cyclomatic, cognitive) complexity in a single pass over the AST.
+
+        Each control flow node adds one decision point, plus its nesting level
+        (the number of enclosing control flow nodes) to the cognitive score.
+        """
+        cyclomatic = 1  # Base complexity
         cognitive = 0
-        nesting_level = 0
         control_flow_nodes = self.CONTROL_FLOW_NODES.get(language, set())
-        
-        def traverse(n: tree_sitter.Node, level: int):
-            nonlocal cognitive
-            
-            if n.type in control_flow_nodes:
-                # Base increment for control flow
-                cognitive += 1
-                
-                # Additional increment for nesting
-                if level > 0:
-                    cognitive += level
-                
-                # Recursively traverse with increased nesting
-                for child in n.children:
-                    traverse(child, level + 1)
-            else:
-                # Continue traversal without increasing nesting for non-control nodes
-                for child in n.children:
-                    traverse(child, level)
-        
-        traverse(node, 0)
-        return cognitive
+        kind_flags = self._kind_flags.setdefault(language, {})
+
+        cursor = node.walk()
+        nesting_level = 0
+        ancestors_are_control = []
+
+        while True:
+            n = cursor.node
+            flags = kind_flags.get(n.kind_id)
+            if flags is None:
+                node_type = n.type
+                flags = (
+                    (self._KIND_CONTROL_FLOW if node_type in control_flow_nodes else 0)
+                    | (self._KIND_LOGICAL_OPERATOR if node_type in ('boolean_operator', 'binary_expression') else 0)
+                )
+                kind_flags[n.kind_id] = flags
+
+            is_control = flags & self._KIND_CONTROL_FLOW
+            if is_control:
+                cyclomatic += 1
+                cognitive += 1 + nesting_level
+
+            # Special handling for logical operators
+            if flags & self._KIND_LOGICAL_OPERATOR:
+                # Count && and || operators on the raw bytes; no need to decode
+                node_text = n.text or b''
+                cyclomatic += node_text.count(b'&&') + node_text.count(b'||')
+
+            if cursor.goto_first_child():
+                ancestors_are_control.append(is_control)
+                nesting_level += is_control
+                continue
+
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return cyclomatic, cognitive
+                nesting_level -= ancestors_are_control.pop()
 
     def _count_effective_lines_of_code(self, node: tree_sitter.Node, code: str, language: str) -> int:
         """Count non-empty, non-comment lines of code."""
@@ -182,8 +205,6 @@ class ComplexityAnalyzer:
 
     def _calculate_maintainability_index(self, cyclomatic: int, cognitive: int, loc: int) -> float:
         """Calculate maintainability index using Microsoft formula (simplified)."""
-        import math
-        
         # Avoid division by zero
         if loc == 0:
             return 100.0
@@ -241,7 +262,10 @@ class ComplexityAnalyzer:
         nested_loops = []
         loop_nodes = self.LOOP_NODES.get(language, set())
         
-        def find_loops(n: tree_sitter.Node, depth: int = 0, parent_is_loop: bool = False):
+        # Explicit pre-order stack of (node, loop depth, parent is loop)
+        stack = [(node, 0, False)]
+        while stack:
+            n, depth, parent_is_loop = stack.pop()
             if n.type in loop_nodes:
                 if parent_is_loop and depth > 1:
                     nested_loops.append({
@@ -251,13 +275,10 @@ class ComplexityAnalyzer:
                     })
                 
                 # Continue searching for deeper nesting
-                for child in n.children:
-                    find_loops(child, depth + 1, True)
-            else:
-                for child in n.children:
-                    find_loops(child, depth, parent_is_loop)
+                depth, parent_is_loop = depth + 1, True
+            
+            stack.extend((child, depth, parent_is_loop) for child in reversed(n.children))
         
-        find_loops(node)
         return nested_loops
 
     def _detect_recursion(self, node: tree_sitter.Node, code: str, language: str) -> List[Dict]:
@@ -270,7 +291,9 @@ class ComplexityAnalyzer:
         self._collect_function_names(node, language, function_names)
         
         # Then find calls to those functions within their own definitions
-        def find_recursive_calls(n: tree_sitter.Node, current_function: Optional[str] = None):
+        stack: List[Tuple[tree_sitter.Node, Optional[str]]] = [(node, None)]
+        while stack:
+            n, current_function = stack.pop()
             # Check if we're entering a function definition
             if self._is_function_definition(n, language):
                 func_name = self._extract_function_name(n, code, language)
@@ -287,10 +310,8 @@ class ComplexityAnalyzer:
                         'type': 'direct_recursion'
                     })
             
-            for child in n.children:
-                find_recursive_calls(child, current_function)
+            stack.extend((child, current_function) for child in reversed(n.children))
         
-        find_recursive_calls(node)
         return recursive_calls
 
     def _detect_complex_loop_operations(self, node: tree_sitter.Node, language: str) -> List[Dict]:
@@ -308,7 +329,9 @@ class ComplexityAnalyzer:
         
         expensive_ops = expensive_operations.get(language, set())
         
-        def find_operations_in_loops(n: tree_sitter.Node, in_loop: bool = False):
+        stack = [(node, False)]
+        while stack:
+            n, in_loop = stack.pop()
             if n.type in loop_nodes:
                 in_loop = True
             
@@ -322,21 +345,21 @@ class ComplexityAnalyzer:
                         'nesting_depth': nesting_depth
                     })
             
-            for child in n.children:
-                find_operations_in_loops(child, in_loop)
+            stack.extend((child, in_loop) for child in reversed(n.children))
         
-        find_operations_in_loops(node)
         return complex_operations
 
     def _collect_function_names(self, node: tree_sitter.Node, language: str, function_names: Set[str]):
         """Collect all function names defined in the code."""
-        if self._is_function_definition(node, language):
-            func_name = self._extract_function_name(node, '', language)
-            if func_name:
-                function_names.add(func_name)
-        
-        for child in node.children:
-            self._collect_function_names(child, language, function_names)
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if self._is_function_definition(n, language):
+                func_name = self._extract_function_name(n, '', language)
+                if func_name:
+                    function_names.add(func_name)
+            
+            stack.extend(reversed(n.children))
 
     def _is_function_definition(self, node: tree_sitter.Node, language: str) -> bool:
         """Check if node is a function definition."""
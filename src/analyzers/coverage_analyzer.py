@@ -9,11 +9,11 @@ from src.interfaces.base_interfaces import (
     FunctionInfo, TestType
 )
 from src.analyzers.coverage_gap_detector import (
-    CoverageGapDetector, DetailedCoverageReport, DetailedCoverageGap
+    CoverageGapDetector, DetailedCoverageReport, DetailedCoverageGap, compile_alternation
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class LineInfo:
     """Information about a line of code."""
     line_number: int
@@ -92,6 +92,16 @@ class CoverageAnalyzer(ICoverageAnalyzer):
             'java': [r'^\s*//', r'^\s*/\*', r'^\s*\*'],
             'javascript': [r'^\s*//', r'^\s*/\*', r'^\s*\*']
         }
+        
+        # Each language's pattern list compiled once into a single alternation,
+        # so classifying a line is one regex match rather than one per pattern
+        self._executable_regex = compile_alternation(self._executable_patterns)
+        self._comment_regex = compile_alternation(self._comment_patterns)
+        self._function_name_regex = {
+            'python': re.compile(r'^\s*def\s+(\w+)'),
+            'java': re.compile(r'\b(\w+)\s*\([^)]*\)\s*{'),
+            'javascript': re.compile(r'^\s*function\s+(\w+)'),
+        }
     
     def estimate_coverage(self, tests: TestSuite, code: str) -> CoverageReport:
         """
@@ -237,29 +247,25 @@ class CoverageAnalyzer(ICoverageAnalyzer):
         code_lines = code.split('\n')
         current_function = None
         
-        executable_patterns = self._executable_patterns.get(language, [])
-        comment_patterns = self._comment_patterns.get(language, [])
+        executable_regex = self._executable_regex.get(language)
+        comment_regex = self._comment_regex.get(language)
+        function_name_regex = self._function_name_regex.get(language)
         
         for i, line in enumerate(code_lines, 1):
             # Check if line is a comment or empty
-            is_comment = any(re.match(pattern, line) for pattern in comment_patterns)
+            is_comment = comment_regex is not None and comment_regex.match(line) is not None
             is_empty = line.strip() == ''
             
             # Check if line is executable
             is_executable = False
-            if not is_comment and not is_empty:
-                is_executable = any(re.match(pattern, line) for pattern in executable_patterns)
+            if not is_comment and not is_empty and executable_regex is not None:
+                is_executable = executable_regex.match(line) is not None
             
             # Track current function context
-            if language == 'python' and re.match(r'^\s*def\s+(\w+)', line):
-                match = re.match(r'^\s*def\s+(\w+)', line)
-                current_function = match.group(1) if match else None
-            elif language == 'java' and re.search(r'\b(\w+)\s*\([^)]*\)\s*{', line):
-                match = re.search(r'\b(\w+)\s*\([^)]*\)\s*{', line)
-                current_function = match.group(1) if match else None
-            elif language == 'javascript' and re.match(r'^\s*function\s+(\w+)', line):
-                match = re.match(r'^\s*function\s+(\w+)', line)
-                current_function = match.group(1) if match else None
+            if function_name_regex is not None:
+                match = function_name_regex.search(line)
+                if match:
+                    current_function = match.group(1)
             
             lines.append(LineInfo(
                 line_number=i,
@@ -274,6 +280,12 @@ class CoverageAnalyzer(ICoverageAnalyzer):
         """Map test cases to covered functions."""
         covered_functions = set()
         
+        # Lowercase each distinct function name once instead of per line and test
+        function_names = {
+            line.function_name: line.function_name.lower()
+            for line in lines if line.function_name
+        }
+        
         for test_case in tests.test_cases:
             # Extract function name from test case
             if test_case.function_name:
@@ -281,9 +293,9 @@ class CoverageAnalyzer(ICoverageAnalyzer):
             
             # Also try to extract from test name patterns
             test_name = test_case.name.lower()
-            for line in lines:
-                if line.function_name and line.function_name.lower() in test_name:
-                    covered_functions.add(line.function_name)
+            for function_name, lowered_name in function_names.items():
+                if lowered_name in test_name:
+                    covered_functions.add(function_name)
         
         return covered_functions
     
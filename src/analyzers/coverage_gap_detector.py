@@ -2,14 +2,26 @@
 Coverage gap detection and reporting system for identifying untested code paths.
 """
 import re
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Set, Optional, Tuple, Any
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 from src.interfaces.base_interfaces import (
     CoverageGap, TestCase, TestType, Language, FunctionInfo
 )
 
 
+
+def compile_alternation(patterns: Dict[str, List[str]]) -> Dict[str, re.Pattern]:
+    """Compile each language's pattern list into one alternation regex."""
+    return {
+        language: re.compile('|'.join(f'(?:{pattern})' for pattern in language_patterns))
+        for language, language_patterns in patterns.items()
+        if language_patterns
+    }
+
+
 class GapType(Enum):
     """Types of coverage gaps."""
     UNTESTED_FUNCTION = "untested_function"
@@ -19,12 +31,12 @@ class GapType(Enum):
     ERROR_HANDLING = "error_handling"
 
 
-class GapSeverity(Enum):
-    """Severity levels for coverage gaps."""
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
+class GapSeverity(IntEnum):
+    """Severity levels for coverage gaps, most severe first."""
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
 
 
 @dataclass
@@ -69,6 +81,9 @@ class CoverageGapDetector:
     analyzes coverage quality, and provides detailed improvement suggestions.
     """
     
+    # Loop headers across the supported languages, matched at the start of a line
+    _LOOP_START = re.compile(r'(?:for|while)\b|do\s*{')
+    
     def __init__(self):
         """Initialize the coverage gap detector."""
         self._branch_patterns = {
@@ -134,6 +149,11 @@ class CoverageGapDetector:
                 r'RangeError',
             ]
         }
+        
+        # A line is flagged as soon as any pattern matches, so each language's
+        # list is compiled once into a single alternation
+        self._branch_regex = compile_alternation(self._branch_patterns)
+        self._error_regex = compile_alternation(self._error_patterns)
     
     def detect_coverage_gaps(self, code: str, language: str, 
                            covered_functions: Set[str], 
@@ -154,6 +174,12 @@ class CoverageGapDetector:
         """
         gaps = []
         code_lines = code.split('\n')
+        coverage_bitmap = self._coverage_bitmap(
+            line_coverage,
+            max(len(code_lines),
+                max(line_coverage, default=0),
+                max((f.line_range[1] for f in functions), default=0)) + 1
+        )
         
         # Detect untested functions
         gaps.extend(self._detect_untested_functions(
@@ -162,22 +188,22 @@ class CoverageGapDetector:
         
         # Detect partial coverage gaps
         gaps.extend(self._detect_partial_coverage(
-            functions, line_coverage, code_lines, language
+            functions, coverage_bitmap, code_lines, language
         ))
         
         # Detect missing edge case coverage
         gaps.extend(self._detect_missing_edge_cases(
-            code_lines, line_coverage, language
+            code_lines, coverage_bitmap, language
         ))
         
         # Detect uncovered branches
         gaps.extend(self._detect_uncovered_branches(
-            code_lines, line_coverage, language
+            code_lines, coverage_bitmap, language
         ))
         
         # Detect missing error handling tests
         gaps.extend(self._detect_error_handling_gaps(
-            code_lines, line_coverage, language
+            code_lines, coverage_bitmap, language
         ))
         
         # Sort gaps by priority and severity
@@ -185,6 +211,15 @@ class CoverageGapDetector:
         
         return gaps
     
+    @staticmethod
+    def _coverage_bitmap(line_coverage: Dict[int, bool], size: int) -> bytearray:
+        """Pack line coverage into one byte per line number (1 = covered)."""
+        bitmap = bytearray(size)
+        for line_num, is_covered in line_coverage.items():
+            if is_covered and 0 <= line_num < size:
+                bitmap[line_num] = 1
+        return bitmap
+    
     def generate_detailed_report(self, code: str, language: str,
                                covered_functions: Set[str],
                                line_coverage: Dict[int, bool],
@@ -289,7 +324,7 @@ class CoverageGapDetector:
         return gaps
     
     def _detect_partial_coverage(self, functions: List[FunctionInfo],
-                               line_coverage: Dict[int, bool],
+                               coverage_bitmap: bytearray,
                                code_lines: List[str],
                                language: str) -> List[DetailedCoverageGap]:
         """Detect functions with partial coverage."""
@@ -297,11 +332,10 @@ class CoverageGapDetector:
         
         for func in functions:
             start_line, end_line = func.line_range
-            func_lines = list(range(start_line, end_line + 1))
+            func_lines = range(start_line, end_line + 1)
             
             # Count covered vs uncovered lines in function
-            covered_count = sum(1 for line_num in func_lines 
-                              if line_coverage.get(line_num, False))
+            covered_count = coverage_bitmap.count(1, start_line, end_line + 1)
             total_count = len(func_lines)
             
             if total_count > 0:
@@ -310,7 +344,7 @@ class CoverageGapDetector:
                 # Flag functions with partial coverage (20-80%)
                 if 0.2 <= coverage_ratio <= 0.8:
                     uncovered_lines = [line_num for line_num in func_lines 
-                                     if not line_coverage.get(line_num, False)]
+                                     if not coverage_bitmap[line_num]]
                     
                     code_snippet = '\n'.join(code_lines[start_line-1:end_line])
                     
@@ -336,7 +370,7 @@ class CoverageGapDetector:
         return gaps
     
     def _detect_missing_edge_cases(self, code_lines: List[str],
-                                 line_coverage: Dict[int, bool],
+                                 coverage_bitmap: bytearray,
                                  language: str) -> List[DetailedCoverageGap]:
         """Detect potential edge cases that lack test coverage."""
         gaps = []
@@ -365,7 +399,7 @@ class CoverageGapDetector:
         patterns = edge_case_patterns.get(language, [])
         
         for i, line in enumerate(code_lines, 1):
-            if not line_coverage.get(i, False):
+            if not coverage_bitmap[i]:
                 for pattern, description in patterns:
                     if re.search(pattern, line):
                         gap = DetailedCoverageGap(
@@ -385,58 +419,56 @@ class CoverageGapDetector:
         return gaps
     
     def _detect_uncovered_branches(self, code_lines: List[str],
-                                 line_coverage: Dict[int, bool],
+                                 coverage_bitmap: bytearray,
                                  language: str) -> List[DetailedCoverageGap]:
         """Detect uncovered conditional branches."""
         gaps = []
-        branch_patterns = self._branch_patterns.get(language, [])
+        branch_regex = self._branch_regex.get(language)
+        if branch_regex is None:
+            return gaps
         
         for i, line in enumerate(code_lines, 1):
-            if not line_coverage.get(i, False):
-                for pattern in branch_patterns:
-                    if re.search(pattern, line):
-                        gap = DetailedCoverageGap(
-                            function_name="unknown",
-                            line_range=(i, i),
-                            description=f"Uncovered branch condition",
-                            suggested_tests=["Add test for this branch condition"],
-                            gap_type=GapType.UNCOVERED_BRANCHES,
-                            severity=GapSeverity.MEDIUM,
-                            confidence=0.8,
-                            code_snippet=line.strip(),
-                            suggested_test_types=[TestType.UNIT, TestType.EDGE],
-                            priority=6
-                        )
-                        gaps.append(gap)
-                        break
+            if not coverage_bitmap[i] and branch_regex.search(line):
+                gap = DetailedCoverageGap(
+                    function_name="unknown",
+                    line_range=(i, i),
+                    description=f"Uncovered branch condition",
+                    suggested_tests=["Add test for this branch condition"],
+                    gap_type=GapType.UNCOVERED_BRANCHES,
+                    severity=GapSeverity.MEDIUM,
+                    confidence=0.8,
+                    code_snippet=line.strip(),
+                    suggested_test_types=[TestType.UNIT, TestType.EDGE],
+                    priority=6
+                )
+                gaps.append(gap)
         
         return gaps
     
     def _detect_error_handling_gaps(self, code_lines: List[str],
-                                  line_coverage: Dict[int, bool],
+                                  coverage_bitmap: bytearray,
                                   language: str) -> List[DetailedCoverageGap]:
         """Detect missing error handling test coverage."""
         gaps = []
-        error_patterns = self._error_patterns.get(language, [])
+        error_regex = self._error_regex.get(language)
+        if error_regex is None:
+            return gaps
         
         for i, line in enumerate(code_lines, 1):
-            if not line_coverage.get(i, False):
-                for pattern in error_patterns:
-                    if re.search(pattern, line):
-                        gap = DetailedCoverageGap(
-                            function_name="unknown",
-                            line_range=(i, i),
-                            description=f"Uncovered error handling code",
-                            suggested_tests=["Add test for error handling scenario"],
-                            gap_type=GapType.ERROR_HANDLING,
-                            severity=GapSeverity.HIGH,
-                            confidence=0.9,
-                            code_snippet=line.strip(),
-                            suggested_test_types=[TestType.EDGE],
-                            priority=8
-                        )
-                        gaps.append(gap)
-                        break
+            if not coverage_bitmap[i] and error_regex.search(line):
+                gap = DetailedCoverageGap(
+                    function_name="unknown",
+                    line_range=(i, i),
+                    description=f"Uncovered error handling code",
+                    suggested_tests=["Add test for error handling scenario"],
+                    gap_type=GapType.ERROR_HANDLING,
+                    severity=GapSeverity.HIGH,
+                    confidence=0.9,
+                    code_snippet=line.strip(),
+                    suggested_test_types=[TestType.EDGE],
+                    priority=8
+                )
+                gaps.append(gap)
         
         return gaps
     
@@ -448,8 +480,8 @@ class CoverageGapDetector:
         total_lines = len(code_lines)
         
         # Count executable lines (non-empty, non-comment)
-        executable_lines = sum(1 for line in code_lines 
-                             if line.strip() and not line.strip().startswith('#'))
+        executable_lines = sum(1 for stripped in map(str.strip, code_lines)
+                             if stripped and not stripped.startswith('#'))
         
         # Count covered lines
         covered_lines = sum(1 for is_covered in line_coverage.values() if is_covered)
@@ -469,9 +501,11 @@ class CoverageGapDetector:
                            if executable_lines > 0 else 0.0
         
         # Calculate complexity-weighted coverage
-        total_complexity = sum(f.complexity for f in functions)
-        covered_complexity = sum(f.complexity for f in functions 
-                               if f.name in covered_functions)
+        total_complexity = covered_complexity = 0
+        for f in functions:
+            total_complexity += f.complexity
+            if f.name in covered_functions:
+                covered_complexity += f.complexity
         complexity_weighted_coverage = (covered_complexity / total_complexity * 100) \
                                      if total_complexity > 0 else 0.0
         
@@ -534,12 +568,9 @@ class CoverageGapDetector:
         suggestions = []
         
         # Group gaps by type for better suggestions
-        gap_groups = {}
+        gap_groups = defaultdict(list)
         for gap in gaps:
-            gap_type = gap.gap_type.value
-            if gap_type not in gap_groups:
-                gap_groups[gap_type] = []
-            gap_groups[gap_type].append(gap)
+            gap_groups[gap.gap_type.value].append(gap)
         
         for gap_type, type_gaps in gap_groups.items():
             suggestion = {
@@ -584,7 +615,7 @@ def test_{gap.function_name}():
     # TODO: Implement test for {gap.function_name}
     # Gap: {gap.description}
     # Lines: {gap.line_range[0]}-{gap.line_range[1]}
-    pass
+{self._nested_loop_input_hint(gap.code_snippet)}    pass
 """
         elif gap.gap_type == GapType.MISSING_EDGE_CASES:
             return f"""
@@ -613,6 +644,44 @@ def test_{gap.function_name}_coverage_gap():
     pass
 """
     
+    def _nested_loop_input_hint(self, code_snippet: str) -> str:
+        """Suggest small inputs when the function under test nests loops.
+
+        Work in nested loops grows as size ** depth, so generated tests for
+        such functions should start from a tiny input rather than a realistic one.
+        """
+        depth = self._loop_nesting_depth(code_snippet)
+        if depth < 2:
+            return ""
+        return (
+            f"    # Loops are nested {depth} deep: work grows as size ** {depth},\n"
+            f"    # so keep generated inputs small to keep this test fast\n"
+            f"    size = 3\n"
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _loop_nesting_depth(code_snippet: str) -> int:
+        """Estimate the maximum loop nesting depth of a snippet from indentation.
+
+        Cached because every suggestion generated for a gap scans the same snippet.
+        """
+        max_depth = 0
+        open_loops: List[int] = []  # indentation of each enclosing loop
+        
+        for line in code_snippet.split('\n'):
+            stripped = line.lstrip()
+            if not stripped:
+                continue
+            indent = len(line) - len(stripped)
+            while open_loops and open_loops[-1] >= indent:
+                open_loops.pop()
+            if CoverageGapDetector._LOOP_START.match(stripped):
+                open_loops.append(indent)
+                max_depth = max(max_depth, len(open_loops))
+        
+        return max_depth
+    
     def _get_gap_type_description(self, gap_type: str) -> str:
         """Get description for gap type."""
         descriptions = {
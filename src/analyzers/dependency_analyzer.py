@@ -69,6 +69,32 @@ class DependencyAnalyzer:
         ]
     }
 
+    # One case-insensitive alternation per category, plus one across all of them
+    EXTERNAL_REGEXES = {
+        category: re.compile('|'.join(patterns), re.IGNORECASE)
+        for category, patterns in EXTERNAL_PATTERNS.items()
+    }
+    ANY_EXTERNAL_REGEX = re.compile(
+        '|'.join(p for patterns in EXTERNAL_PATTERNS.values() for p in patterns),
+        re.IGNORECASE,
+    )
+
+    # Single-pass, line-anchored import patterns for the text-based fallback
+    TEXT_IMPORT_PATTERNS = {
+        'python': re.compile(
+            r"^[^\S\n]*(?:import[^\S\n]+(?P<import>[\w\.]+)"
+            r"|from[^\S\n]+(?P<from_import>[\w\.]+)[^\S\n]+import[^\S\n](?:[^\S\n]|[\w\*,])).*",
+            re.M,
+        ),
+        'javascript': re.compile(
+            r"^[^\S\n]*(?:import[^\S\n]+.*from[^\S\n]+['\"](?P<import>[^'\"\n]+)['\"]"
+            r"|const[^\S\n]+\w+[^\S\n]*=[^\S\n]*require\(['\"](?P<require>[^'\"\n]+)['\"]\)).*",
+            re.M,
+        ),
+        'java': re.compile(r"^[^\S\n]*import[^\S\n]+(?P<import>[\w\.\*]+);.*", re.M),
+    }
+    TEXT_IMPORT_PATTERNS['typescript'] = TEXT_IMPORT_PATTERNS['javascript']
+
     def detect(self, code: str, language: str, ast_node: Optional[tree_sitter.Node] = None) -> List[Dependency]:
         """Detect dependencies using both AST and pattern-based analysis."""
         if ast_node is not None:
@@ -78,35 +104,14 @@ class DependencyAnalyzer:
 
     def _detect_text_based(self, code: str, language: str) -> List[Dependency]:
         """Fallback text-based dependency detection for backward compatibility."""
-        deps: List[Dependency] = []
-        lines = code.splitlines()
+        pattern = self.TEXT_IMPORT_PATTERNS.get(language)
+        if pattern is None:
+            return []
 
-        def add(name: str, kind: str, source: str = None):
-            deps.append(Dependency(name=name, type=kind, source=source))
-
-        if language == 'python':
-            for ln in lines:
-                m = re.match(r"\s*import\s+([\w\.]+)", ln)
-                if m:
-                    add(m.group(1), 'import', ln.strip())
-                m = re.match(r"\s*from\s+([\w\.]+)\s+import\s+([\w\*,\s]+)", ln)
-                if m:
-                    add(m.group(1), 'import', ln.strip())
-        elif language in ('javascript', 'typescript'):
-            for ln in lines:
-                m = re.match(r"\s*import\s+.*from\s+['\"]([^'\"]+)['\"]", ln)
-                if m:
-                    add(m.group(1), 'import', ln.strip())
-                m = re.match(r"\s*const\s+\w+\s*=\s*require\(['\"]([^'\"]+)['\"]\)\s*;?", ln)
-                if m:
-                    add(m.group(1), 'import', ln.strip())
-        elif language == 'java':
-            for ln in lines:
-                m = re.match(r"\s*import\s+([\w\.\*]+);", ln)
-                if m:
-                    add(m.group(1), 'import', ln.strip())
-
-        return deps
+        return [
+            Dependency(name=m.group(m.lastgroup), type='import', source=m.group(0).strip())
+            for m in pattern.finditer(code)
+        ]
 
     def _detect_with_ast(self, ast_node: tree_sitter.Node, code: str, language: str) -> List[Dependency]:
         """Comprehensive AST-based dependency detection."""
@@ -255,10 +260,8 @@ class DependencyAnalyzer:
         call_name = call_info['name'].lower()
         
         # Check against known external patterns
-        for category, patterns in self.EXTERNAL_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, call_name, re.IGNORECASE):
-                    return True
+        if self.ANY_EXTERNAL_REGEX.search(call_name):
+            return True
         
         # Check for common external call patterns
         external_indicators = [
@@ -341,15 +344,14 @@ class DependencyAnalyzer:
             dep_name = dep.name.lower()
             
             # Categorize based on patterns
-            for category, patterns in self.EXTERNAL_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, dep_name, re.IGNORECASE):
-                        # Update the type to be more specific
-                        if dep.type == 'import':
-                            dep.type = f'import_{category}'
-                        elif dep.type == 'external_call':
-                            dep.type = f'call_{category}'
-                        break
+            for category, regex in self.EXTERNAL_REGEXES.items():
+                if regex.search(dep_name):
+                    # Update the type to be more specific
+                    if dep.type == 'import':
+                        dep.type = f'import_{category}'
+                    elif dep.type == 'external_call':
+                        dep.type = f'call_{category}'
+                    break
 
     def analyze_dependency_complexity(self, dependencies: List[Dependency]) -> List[EdgeCase]:
         """Analyze dependencies for potential complexity and risk issues."""
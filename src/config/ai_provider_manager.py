@@ -1,6 +1,7 @@
 """
 AI Provider Manager - Manages AI provider selection and fallback logic
 """
+from functools import cached_property
 from typing import Dict, Any, Optional, List
 from src.interfaces.base_interfaces import IAIProvider
 from src.factories.ai_provider_factory import AIProviderFactory
@@ -12,11 +13,19 @@ class AIProviderManager:
     
     def __init__(self, config_manager: Optional[ConfigurationManager] = None):
         self.config_manager = config_manager or ConfigurationManager()
-        self.factory = AIProviderFactory()
         self._current_provider: Optional[IAIProvider] = None
-        self._provider_health: Dict[str, bool] = {}
         self._fallback_order = ['openai', 'anthropic', 'mock']
     
+    @cached_property
+    def factory(self) -> AIProviderFactory:
+        """Provider factory, built the first time a provider is created."""
+        return AIProviderFactory()
+    
+    @cached_property
+    def _provider_health(self) -> Dict[str, bool]:
+        """Health results per provider type, allocated on the first check."""
+        return {}
+    
     def get_provider(self) -> IAIProvider:
         """Get the current AI provider, creating one if necessary."""
         if self._current_provider is None:
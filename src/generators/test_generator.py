@@ -4,6 +4,7 @@ Test Generator - Generates unit, integration, and edge test cases with AI integr
 from typing import List, Dict, Any, Optional
 from src.analyzers.code_analyzer import AnalysisResult, FunctionInfo
 from src.interfaces.base_interfaces import TestType, TestCase, TestSuite, Language, ITestGenerator
+from src.interfaces.base_interfaces import FunctionInfo as InterfaceFunctionInfo, Parameter as InterfaceParameter
 from src.config.ai_provider_manager import AIProviderManager
 from .integration_test_generator import IntegrationTestGenerator
 
@@ -101,9 +102,6 @@ class TestGenerator(ITestGenerator):
     
     def generate_integration_tests(self, dependencies: List) -> List[TestCase]:
         """Generate integration tests with mocking strategies (interface implementation)."""
-        # Import the correct FunctionInfo from interfaces
-        from ..interfaces.base_interfaces import FunctionInfo as InterfaceFunctionInfo, Parameter
-        
         # Create a dummy function info for interface compatibility
         dummy_function = InterfaceFunctionInfo(
             name="integration_test_function",
@@ -385,11 +383,10 @@ void tearDown() {
         # Use the specialized integration test generator
         # Adapt analyzer FunctionInfo to interface FunctionInfo expected by the integration generator
         try:
-            from ..interfaces.base_interfaces import FunctionInfo as IFFunctionInfo, Parameter as IFParameter
             param_names = self._get_param_names(function)
-            iface_func = IFFunctionInfo(
+            iface_func = InterfaceFunctionInfo(
                 name=function.name,
-                parameters=[IFParameter(name=n) for n in param_names],
+                parameters=[InterfaceParameter(name=n) for n in param_names],
                 return_type=getattr(function, 'return_type', None),
                 complexity=getattr(function, 'complexity', 1),
                 line_range=(getattr(function, 'line_start', 1), getattr(function, 'line_end', 1)),
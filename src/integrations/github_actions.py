@@ -2,7 +2,6 @@
 GitHub Actions Integration - Automated test suggestions on PRs
 """
 import os
-import json
 import requests
 from typing import Dict, List, Any, Optional
 from pathlib import Path
@@ -33,7 +33,7 @@ class CodeAnalysis:
     complexity_metrics: 'ComplexityMetrics'
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function or method."""
     name: str
@@ -53,7 +53,7 @@ class ClassInfo:
     inheritance: List[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     """Function parameter information."""
     name: str
@@ -87,7 +87,7 @@ class ComplexityMetrics:
     maintainability_index: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     """Generated test case."""
     name: str